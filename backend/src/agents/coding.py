@@ -12,7 +12,7 @@ Compatible with:
 from langchain.agents import create_agent
 from langchain_core.tools import tool
 from src.utils.model import get_coding_model
-from src.utils.paths import get_prompt_path
+from src.utils.paths import load_prompt
 from src.state.schemas import AppBuilderState
 from src.mcp_config.client import get_mcp_tools
 from src.tools.feature_tools import (
@@ -36,6 +36,7 @@ from src.tools.memory_tools import (
     save_lesson,
     read_memory
 )
+from src.utils import progress_log
 import os
 import json
 import subprocess
@@ -90,14 +91,8 @@ def read_progress_log(repo_path: str) -> list[dict]:
         >>> read_progress_log("/path/to/repo")
         [{"timestamp": "...", "agent": "initializer", ...}]
     """
-    log_path = os.path.join(repo_path, "progress_log.json")
-
-    if not os.path.exists(log_path):
-        return []
-
     try:
-        with open(log_path, "r") as f:
-            return json.load(f)
+        return progress_log.read_entries(repo_path)
     except Exception as e:
         return [{"error": f"Failed to read progress log: {e}"}]
 
@@ -125,16 +120,7 @@ def update_progress_log_entry(
     Returns:
         Success message
     """
-    log_path = os.path.join(repo_path, "progress_log.json")
-
-    # Read existing log
-    if os.path.exists(log_path):
-        with open(log_path, "r") as f:
-            log = json.load(f)
-    else:
-        log = []
-
-    # Add new entry
+    # Append new entry (O(1) JSONL append, no full-file rewrite)
     entry = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "agent": agent,
@@ -144,11 +130,7 @@ def update_progress_log_entry(
         "notes": notes
     }
 
-    log.append(entry)
-
-    # Write back
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(log, f, indent=2)
+    progress_log.append_entry(repo_path, entry)
 
     print(f"\n{'='*60}")
     print(f"[QA] PROGRESS LOG UPDATED")
@@ -192,9 +174,7 @@ async def create_coding_agent():
         Compiled agent
     """
     # Load system prompt
-    prompt_path = get_prompt_path("coding.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = load_prompt("coding.txt")
 
     # Get model
     model = get_coding_model()
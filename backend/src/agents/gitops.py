@@ -15,7 +15,7 @@ Compatible with:
 
 from langchain.agents import create_agent
 from src.utils.model import get_coding_model
-from src.utils.paths import get_prompt_path
+from src.utils.paths import load_prompt
 from src.state.schemas import AppBuilderState
 from src.mcp_config.client import get_mcp_tools
 from src.tools.git_tools import (
@@ -44,9 +44,7 @@ async def create_gitops_agent():
         Compiled agent
     """
     # Load system prompt
-    prompt_path = get_prompt_path("gitops.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = load_prompt("gitops.txt")
     
     # Get model (reuse coding model for now)
     model = get_coding_model()
@@ -13,7 +13,7 @@ from langchain.agents import create_agent
 from langchain_core.tools import tool
 from langchain.tools import InjectedState  # Using InjectedState instead of ToolRuntime (bug workaround)
 from src.utils.model import get_initializer_model
-from src.utils.paths import get_prompt_path
+from src.utils.paths import load_prompt
 from src.state.schemas import AppBuilderState
 from src.tools.feature_tools import (
     generate_feature_list_from_description,
@@ -27,6 +27,7 @@ from src.tools.filesystem_tools import (
     file_exists
 )
 from src.mcp_config.client import get_mcp_tools
+from src.utils import progress_log
 import os
 import json
 from datetime import datetime
@@ -159,13 +160,13 @@ def initialize_progress_log(
     state: Annotated[dict, InjectedState]
 ) -> str:
     """
-    Create initial progress_log.json file
+    Create the initial progress log entry
 
     Args:
         project_metadata: Project metadata dict
 
     Returns:
-        Path to created progress_log.json
+        Path to progress_log.jsonl
     """
     repo_path = state["repo_path"]
     log_entry = {
@@ -179,13 +180,9 @@ def initialize_progress_log(
         "notes": f"Initialized {project_metadata.get('type')} project in {project_metadata.get('domain')} domain"
     }
 
-    log_path = os.path.join(repo_path, "progress_log.json")
     os.makedirs(repo_path, exist_ok=True)
 
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump([log_entry], f, indent=2)
-
-    return log_path
+    return progress_log.append_entry(repo_path, log_entry)
 
 
 @tool
@@ -281,9 +278,7 @@ async def create_initializer_agent():
         Compiled agent
     """
     # Load system prompt
-    prompt_path = get_prompt_path("initializer.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = load_prompt("initializer.txt")
 
     # Get model
     model = get_initializer_model()
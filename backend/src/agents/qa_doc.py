@@ -12,7 +12,7 @@ Compatible with:
 from langchain.agents import create_agent
 from langchain_core.tools import tool
 from src.utils.model import get_qa_model
-from src.utils.paths import get_prompt_path
+from src.utils.paths import load_prompt
 from src.state.schemas import AppBuilderState
 from src.mcp_config.client import get_mcp_tools
 from src.tools.code_quality import (
@@ -21,8 +21,8 @@ from src.tools.code_quality import (
     run_all_quality_checks
 )
 from src.tools.feature_tools import update_feature_status
+from src.utils import progress_log
 import os
-import json
 from datetime import datetime
 
 
@@ -48,16 +48,7 @@ def update_qa_progress_log(
     Returns:
         Success message
     """
-    log_path = os.path.join(repo_path, "progress_log.json")
-
-    # Read existing log
-    if os.path.exists(log_path):
-        with open(log_path, "r", encoding="utf-8") as f:
-            log = json.load(f)
-    else:
-        log = []
-
-    # Add new entry
+    # Append new entry (O(1) JSONL append, no full-file rewrite)
     entry = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "agent": "qa_doc",
@@ -67,11 +58,7 @@ def update_qa_progress_log(
         "notes": notes
     }
 
-    log.append(entry)
-
-    # Write back
-    with open(log_path, "w", encoding="utf-8") as f:
-        json.dump(log, f, indent=2)
+    progress_log.append_entry(repo_path, entry)
 
     print(f"\n{'='*60}")
     print(f"[QA] PROGRESS LOG UPDATED")
@@ -319,9 +306,7 @@ async def create_qa_doc_agent():
         Compiled agent
     """
     # Load system prompt
-    prompt_path = get_prompt_path("qa_doc.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    system_prompt = load_prompt("qa_doc.txt")
 
     # Get model
     model = get_qa_model()
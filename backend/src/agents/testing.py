@@ -12,22 +12,38 @@ Compatible with:
 from langchain.agents import create_agent
 from langchain_core.tools import tool
 from src.utils.model import get_test_model
-from src.utils.paths import get_prompt_path
+from src.utils.paths import load_prompt
 from src.state.schemas import AppBuilderState
 from src.mcp_config.client import get_mcp_tools
 from src.tools.test_tools import (
     run_playwright_tests,
     run_pytest_tests,
-    validate_acceptance_criteria
+    validate_acceptance_criteria,
+    utc_timestamp
 )
 from src.tools.feature_tools import update_feature_status
+from src.utils import fastjson
+from functools import lru_cache
+from typing import Optional
+import asyncio
 import os
-import json
-from datetime import datetime
+
+
+@lru_cache(maxsize=128)
+def _ensure_results_dir(path: str) -> str:
+    """Create a results directory once per path (cached across calls)"""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Blocking write, run via asyncio.to_thread off the agent's loop"""
+    with open(path, "wb") as f:
+        f.write(data)
 
 
 @tool
-def save_test_results(
+async def save_test_results(
     repo_path: str,
     feature_id: str,
     test_results: dict
@@ -43,14 +59,11 @@ def save_test_results(
     Returns:
         Path to saved results file
     """
-    results_dir = os.path.join(repo_path, "test-results")
-    os.makedirs(results_dir, exist_ok=True)
-
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    results_file = os.path.join(results_dir, f"{feature_id}_{timestamp}.json")
+    results_dir = _ensure_results_dir(os.path.join(repo_path, "test-results"))
+    results_file = os.path.join(results_dir, f"{feature_id}_{utc_timestamp()}.json")
 
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump(test_results, f, indent=2)
+    payload = fastjson.dumps(test_results, option=fastjson.OPT_INDENT_2)
+    await asyncio.to_thread(_write_bytes, results_file, payload)
 
     return results_file
 
@@ -78,10 +91,9 @@ def capture_test_screenshot(
     screenshots_dir = os.path.join(repo_path, "test-results", "screenshots")
     os.makedirs(screenshots_dir, exist_ok=True)
 
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     screenshot_path = os.path.join(
         screenshots_dir,
-        f"{feature_id}_{screenshot_name}_{timestamp}.png"
+        f"{feature_id}_{screenshot_name}_{utc_timestamp()}.png"
     )
 
     return f"Screenshot would be saved to: {screenshot_path}"
@@ -155,18 +167,39 @@ def determine_test_strategy(project_metadata: dict, feature: dict) -> dict:
     return strategy
 
 
+# Cached across invocations — the prompt, model config and tool set never
+# change within a run, so the compiled agent is built once and reused
+_AGENT_SINGLETON = None
+_AGENT_LOCK: Optional[asyncio.Lock] = None
+
+
 # Create Test Agent with LangChain 1.0 pattern
 async def create_test_agent():
     """
-    Create the Test Agent using LangChain 1.0's create_agent
+    Create (or return the cached) Test Agent using LangChain 1.0's create_agent
 
     Returns:
         Compiled agent
     """
-    # Load system prompt
-    prompt_path = get_prompt_path("testing.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read()
+    global _AGENT_SINGLETON, _AGENT_LOCK
+
+    if _AGENT_SINGLETON is not None:
+        return _AGENT_SINGLETON
+
+    if _AGENT_LOCK is None:
+        _AGENT_LOCK = asyncio.Lock()
+
+    async with _AGENT_LOCK:
+        if _AGENT_SINGLETON is not None:
+            return _AGENT_SINGLETON
+        _AGENT_SINGLETON = await _build_test_agent()
+        return _AGENT_SINGLETON
+
+
+async def _build_test_agent():
+    """One-time agent construction (prompt read, MCP handshake, compile)"""
+    # Load system prompt (cached in paths.load_prompt)
+    system_prompt = load_prompt("testing.txt")
 
     # Get model
     model = get_test_model()
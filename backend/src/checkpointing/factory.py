@@ -9,6 +9,7 @@ This module provides a singleton factory for creating and managing
 AsyncPostgresSaver instances for durable state persistence.
 """
 
+import asyncio
 import os
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg_pool import AsyncConnectionPool
@@ -26,6 +27,7 @@ class CheckpointerFactory:
 
     _instance: Optional[AsyncPostgresSaver] = None
     _pool: Optional[AsyncConnectionPool] = None
+    _init_lock: Optional[asyncio.Lock] = None  # created lazily on first use
 
     @classmethod
     async def get_checkpointer(cls, force_new: bool = False) -> AsyncPostgresSaver:
@@ -42,7 +44,13 @@ class CheckpointerFactory:
             ValueError: If DATABASE_URL not set
         """
         if cls._instance is None or force_new:
-            await cls._initialize()
+            # Double-checked locking: concurrent first calls must not each
+            # open a pool and race setup() (CREATE INDEX CONCURRENTLY)
+            if cls._init_lock is None:
+                cls._init_lock = asyncio.Lock()
+            async with cls._init_lock:
+                if cls._instance is None or force_new:
+                    await cls._initialize()
 
         return cls._instance  # type: ignore
 
@@ -65,12 +73,21 @@ class CheckpointerFactory:
         async def configure_conn(conn: AsyncConnection):
             await conn.set_autocommit(True)
 
+        # Pool sizing is the throughput ceiling for concurrent checkpoint
+        # writes; make it tunable and recycle idle/stale connections
+        max_size = int(os.getenv("CHECKPOINT_POOL_MAX", "32"))
+
         cls._pool = AsyncConnectionPool(
             conninfo=database_url,
             min_size=2,
-            max_size=10,
+            max_size=max_size,
+            max_idle=300,
+            max_lifetime=1800,
             timeout=60,
             configure=configure_conn,
+            # prepare_threshold=0 caches prepared statements immediately,
+            # cutting parse/plan overhead on the hot checkpoint queries
+            kwargs={"prepare_threshold": 0},
             open=False  # Don't open in constructor (avoid deprecation warning)
         )
 
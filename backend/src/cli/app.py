@@ -39,18 +39,26 @@ class BuilderApp(App):
         """Show setup screen on startup"""
         self.push_screen(SetupScreen())
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
         """Quit the application with graceful shutdown"""
-        # Gracefully stop workflow if running
+        # Gracefully stop workflow if running — awaited on Textual's own
+        # loop (run_until_complete would raise/block inside a running loop)
         from src.cli.runner.workflow_runner import WorkflowRunner
+        from src.checkpointing.factory import CheckpointerFactory
+
         if WorkflowRunner.is_running():
             self.notify("Stopping workflow...", severity="warning")
-            # Run async stop in a sync context
-            import asyncio
             try:
-                asyncio.get_event_loop().run_until_complete(WorkflowRunner.stop())
+                await WorkflowRunner.stop()
             except Exception as e:
                 self.notify(f"Error stopping workflow: {str(e)}", severity="error")
+
+        # Release the checkpointer's connection pool before exiting
+        try:
+            await CheckpointerFactory.close()
+        except Exception:
+            pass
+
         self.exit()
 
     def action_toggle_pause(self) -> None:
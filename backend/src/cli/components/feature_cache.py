@@ -0,0 +1,43 @@
+"""
+Shared feature-list cache for dashboard widgets
+
+FeatureTable and StatusHeader both render from feature_list.json; this
+module parses it once per change (keyed by mtime + size) so the widgets
+share a single read and parse instead of each doing their own.
+"""
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils import fastjson
+
+# path -> (version, parsed features) where version is (st_mtime_ns, st_size)
+_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_features(feature_path: str) -> Tuple[Optional[list], Optional[Tuple[int, int]]]:
+    """
+    Return (features, version) for feature_path, or (None, None) if missing
+
+    version is an opaque (st_mtime_ns, st_size) tuple; widgets compare it
+    against the last version they rendered to skip redundant UI work.
+
+    Blocking (stat + possible read) — dashboard widgets call this via
+    asyncio.to_thread. Raises fastjson.JSONDecodeError on corrupt files.
+    """
+    try:
+        st = os.stat(feature_path)
+    except FileNotFoundError:
+        return None, None
+
+    version = (st.st_mtime_ns, st.st_size)
+    entry = _cache.get(feature_path)
+    if entry is not None and entry[0] == version:
+        return entry[1], version
+
+    features = fastjson.load_path(feature_path)
+    _cache[feature_path] = (version, features)
+    return features, version
+
+
+__all__ = ["load_features"]
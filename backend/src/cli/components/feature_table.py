@@ -4,14 +4,42 @@ Feature Board Table Widget
 Displays features with color-coded statuses in a reactive table.
 """
 
+import asyncio
 import os
-import json
+from functools import lru_cache
 from typing import List, Dict, Any
+from src.utils import fastjson
+from src.cli.components import feature_cache
 from textual.widgets import DataTable
 from textual.app import ComposeResult
 from rich.text import Text
 
 
+# Display text + color for each known feature status
+_STATUS_STYLES = {
+    "done": ("[OK] done", "#00D9A3"),
+    "testing": ("[FAST] testing", "#FFD700"),
+    "in_progress": ("-> in_progress", "#3B82F6"),
+    "coding": ("[BUILD] coding", "#3B82F6"),
+    "pending": ("o pending", "#666666"),
+    "failed": ("[EMOJI] failed", "#FF6B6B"),
+    "blocked": ("[EMOJI] blocked", "#FF6B6B"),
+}
+
+# Prebuilt Text per known status — the set is tiny and the objects never
+# change, so refreshes reuse them instead of allocating per row
+_STATUS_TEXT = {
+    status: Text(display, style=style)
+    for status, (display, style) in _STATUS_STYLES.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _fallback_status_text(status: str) -> Text:
+    """Memoized Text for statuses outside the known set"""
+    return Text(f"? {status}", style="#999999")
+
+
 class FeatureTable(DataTable):
     """
     Feature board table with color-coded statuses
@@ -31,65 +59,116 @@ class FeatureTable(DataTable):
         self.project_name = project_name
         self.cursor_type = "row"
         self.zebra_stripes = True
+        # Paths are fixed for the widget's lifetime; compute them once
+        base = os.path.join(os.getenv("OUTPUT_DIR", "./output"), project_name)
+        self._feature_path = os.path.join(base, "feature_list.json")
+        # Version of the shared feature cache last rendered, so unchanged
+        # polls skip all UI work
+        self._version = None
+        # Per-row snapshot of (title, status, attempts, priority) so a
+        # refresh only touches cells that actually changed
+        self._row_state: Dict[str, tuple] = {}
+        self._column_keys: list = []
 
     def on_mount(self) -> None:
         """Initialize table structure"""
-        self.add_columns("ID", "Title", "Status", "Attempts", "Priority")
+        self._column_keys = self.add_columns("ID", "Title", "Status", "Attempts", "Priority")
 
     async def refresh_from_disk(self) -> None:
         """
         Read feature_list.json and update table with color-coded statuses
         """
-        repo_path = os.path.join(
-            os.getenv("OUTPUT_DIR", "./output"),
-            self.project_name
-        )
-        feature_path = os.path.join(repo_path, "feature_list.json")
-
-        if not os.path.exists(feature_path):
-            # Show empty state
-            if self.row_count == 0:
-                self.add_row("—", "Initializing project...", "—", "—", "—")
-            return
+        feature_path = self._feature_path
 
         try:
-            with open(feature_path, "r", encoding="utf-8") as f:
-                features = json.load(f)
+            # Shared cache: parses once per file change, no matter how
+            # many widgets consume the same feature list
+            features, version = await asyncio.to_thread(
+                feature_cache.load_features, feature_path
+            )
+
+            if features is None:
+                # Show empty state
+                if self.row_count == 0:
+                    self.add_row("—", "Initializing project...", "—", "—", "—")
+                return
 
-            # Clear existing rows
-            self.clear()
+            # Skip all UI work when the file hasn't changed
+            if version == self._version:
+                return
+            self._version = version
 
             if not features:
-                self.add_row("—", "No features yet", "—", "—", "—")
+                self._show_message_row("—", "No features yet", "—", "—", "—")
                 return
 
-            # Add feature rows with color-coded statuses
-            for feature in features:
-                feature_id = feature.get("id", "N/A")
-                title = feature.get("title", "Untitled")[:50]  # Truncate long titles
-                status = feature.get("status", "pending")
-                attempts = str(feature.get("attempts", 0))
-                priority = str(feature.get("priority", 0))
+            self._apply_features(features)
+
+        except fastjson.JSONDecodeError:
+            # Handle corrupted JSON
+            self._show_message_row("ERROR", "Failed to parse feature_list.json", "—", "—", "—")
+        except Exception as e:
+            # Handle other errors
+            self._show_message_row("ERROR", f"Error loading features: {str(e)[:40]}", "—", "—", "—")
+
+    def _show_message_row(self, *cells) -> None:
+        """Replace all content with a single unkeyed message row"""
+        self.clear()
+        self._row_state.clear()
+        self.add_row(*cells)
 
-                # Apply status colors
-                status_text = self._colorize_status(status)
+    def _apply_features(self, features: List[Dict[str, Any]]) -> None:
+        """
+        Diff parsed features against the current rows
+
+        Adds rows for new features, updates only changed cells for
+        existing ones, and removes rows for features that disappeared —
+        so a typical tick touches 0-1 rows instead of rebuilding the table.
+        """
+        if not self._row_state and self.row_count:
+            # Replace placeholder/message rows with keyed feature rows
+            self.clear()
+
+        seen = set()
+
+        for feature in features:
+            feature_id = str(feature.get("id", "N/A"))
+            title = feature.get("title", "Untitled")[:50]  # Truncate long titles
+            status = feature.get("status", "pending")
+            attempts = str(feature.get("attempts", 0))
+            priority = str(feature.get("priority", 0))
+
+            seen.add(feature_id)
+            new_state = (title, status, attempts, priority)
+            old_state = self._row_state.get(feature_id)
 
+            if old_state is None:
                 self.add_row(
                     Text(feature_id, style="bold cyan"),
                     title,
-                    status_text,
+                    self._colorize_status(status),
                     attempts,
-                    priority
+                    priority,
+                    key=feature_id
                 )
-
-        except json.JSONDecodeError:
-            # Handle corrupted JSON
-            self.clear()
-            self.add_row("ERROR", "Failed to parse feature_list.json", "—", "—", "—")
-        except Exception as e:
-            # Handle other errors
-            self.clear()
-            self.add_row("ERROR", f"Error loading features: {str(e)[:40]}", "—", "—", "—")
+            elif old_state != new_state:
+                cols = self._column_keys
+                if title != old_state[0]:
+                    self.update_cell(feature_id, cols[1], title)
+                if status != old_state[1]:
+                    self.update_cell(feature_id, cols[2], self._colorize_status(status))
+                if attempts != old_state[2]:
+                    self.update_cell(feature_id, cols[3], attempts)
+                if priority != old_state[3]:
+                    self.update_cell(feature_id, cols[4], priority)
+
+            self._row_state[feature_id] = new_state
+
+        # Drop rows for features no longer in the file
+        for feature_id in list(self._row_state):
+            if feature_id not in seen:
+                self.remove_row(feature_id)
+                del self._row_state[feature_id]
 
     def _colorize_status(self, status: str) -> Text:
         """
@@ -99,21 +178,7 @@ class FeatureTable(DataTable):
             status: Feature status string
 
         Returns:
-            Rich Text object with color styling
+            Rich Text object with color styling (shared, do not mutate)
         """
-        status_styles = {
-            "done": ("[OK] done", "#00D9A3"),
-            "testing": ("[FAST] testing", "#FFD700"),
-            "in_progress": ("-> in_progress", "#3B82F6"),
-            "coding": ("[BUILD] coding", "#3B82F6"),
-            "pending": ("o pending", "#666666"),
-            "failed": ("[EMOJI] failed", "#FF6B6B"),
-            "blocked": ("[EMOJI] blocked", "#FF6B6B"),
-        }
-
-        display_text, style = status_styles.get(
-            status.lower(),
-            (f"? {status}", "#999999")
-        )
-
-        return Text(display_text, style=style)
+        key = status.lower()
+        return _STATUS_TEXT.get(key) or _fallback_status_text(key)
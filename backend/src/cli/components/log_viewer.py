@@ -4,13 +4,55 @@ Log Viewer Widget
 Real-time log streaming with auto-scroll and color-coded agents.
 """
 
+import asyncio
 import os
-import json
+from collections import deque
+from functools import lru_cache
 from typing import List, Dict, Any
+from src.utils import fastjson
 from textual.widgets import RichLog
 from rich.text import Text
 
 
+# Display tag + color for each known agent
+_AGENT_COLORS = {
+    "initializer": ("INIT", "#A78BFA"),
+    "coding": ("CODE", "#3B82F6"),
+    "testing": ("TEST", "#FFD700"),
+    "gitops": ("GIT", "#00D9A3"),
+    "qa_doc": ("QA", "#60A5FA"),
+    "system": ("SYS", "#999999"),
+    "router": ("ROUT", "#A78BFA"),
+}
+
+# Prebuilt Text per known agent — reused across log lines instead of
+# allocating a new Text for every entry
+_AGENT_TEXT = {
+    agent: Text(f"[{display}]", style=style)
+    for agent, (display, style) in _AGENT_COLORS.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _fallback_agent_text(agent: str) -> Text:
+    """Memoized Text for agents outside the known set"""
+    return Text(f"[{agent.upper()[:4]}]", style="#999999")
+
+
+# Rich style per status keyword
+_LOG_STATUS_STYLES = {
+    "success": "#00D9A3",
+    "completed": "#00D9A3",
+    "done": "#00D9A3",
+    "failed": "#FF6B6B",
+    "error": "#FF6B6B",
+    "warning": "#FFD700",
+    "pending": "#666666",
+    "running": "#3B82F6",
+    "testing": "#FFD700",
+}
+
+
 class LogViewer(RichLog):
     """
     Real-time log viewer with auto-scroll
@@ -23,10 +65,21 @@ class LogViewer(RichLog):
     """
 
     def __init__(self, project_name: str, **kwargs):
+        # max_lines makes RichLog rotate old lines out in O(1), keeping
+        # memory and render cost bounded over long runs
+        kwargs.setdefault("max_lines", 1000)
         super().__init__(**kwargs)
         self.project_name = project_name
         self.last_log_count = 0
-        self.max_lines = 1000
+        # Paths are fixed for the widget's lifetime; compute them once
+        base = os.path.join(os.getenv("OUTPUT_DIR", "./output"), project_name)
+        self._jsonl_path = os.path.join(base, "progress_log.jsonl")
+        self._log_path = os.path.join(base, "progress_log.json")
+        # Cache of the last file state so unchanged polls skip read + parse
+        self._mtime_ns = 0
+        self._size = 0
+        # Byte offset into progress_log.jsonl for incremental reads
+        self._offset = 0
 
     def on_mount(self) -> None:
         """Configure log viewer on mount"""
@@ -40,33 +93,52 @@ class LogViewer(RichLog):
 
     async def refresh_from_disk(self) -> None:
         """
-        Read progress_log.json and append new entries
+        Read the progress log and append new entries
 
-        Only adds logs since last refresh to avoid duplicates.
+        Prefers the append-only progress_log.jsonl format (read
+        incrementally from a byte offset, O(new bytes) per tick) and
+        falls back to the legacy progress_log.json array.
         """
-        repo_path = os.path.join(
-            os.getenv("OUTPUT_DIR", "./output"),
-            self.project_name
-        )
-        log_path = os.path.join(repo_path, "progress_log.json")
+        try:
+            await self._refresh_from_jsonl(self._jsonl_path)
+            return
+        except FileNotFoundError:
+            # No JSONL yet — fall back to the legacy array format
+            pass
+
+        log_path = self._log_path
+
+        try:
+            # One stat decides both existence and cache validity (no
+            # separate exists() syscall)
+            st = os.stat(log_path)
+        except FileNotFoundError:
+            return
 
-        if not os.path.exists(log_path):
+        if (st.st_mtime_ns, st.st_size) == (self._mtime_ns, self._size):
             return
 
         try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                logs = json.load(f)
+            # Read + parse off the event loop; only the stat stays on-loop
+            logs = await asyncio.to_thread(fastjson.load_path, log_path)
 
-            # Only process new logs
+            self._mtime_ns = st.st_mtime_ns
+            self._size = st.st_size
+
+            # Only process new logs, keeping at most max_lines of them —
+            # anything older would be rotated out of the RichLog anyway
             if len(logs) > self.last_log_count:
-                new_logs = logs[self.last_log_count:]
+                new_logs = deque(
+                    logs[self.last_log_count:],
+                    maxlen=self.max_lines or None
+                )
 
                 for log_entry in new_logs:
                     self._write_log_entry(log_entry)
 
                 self.last_log_count = len(logs)
 
-        except json.JSONDecodeError:
+        except fastjson.JSONDecodeError:
             # Handle corrupted JSON
             if self.last_log_count == 0:
                 self.write(Text("[EMOJI] Error: Failed to parse progress_log.json", style="bold red"))
@@ -75,6 +147,63 @@ class LogViewer(RichLog):
             if self.last_log_count == 0:
                 self.write(Text(f"[EMOJI] Error loading logs: {str(e)}", style="bold red"))
 
+    def _read_new_jsonl_bytes(self, log_path: str) -> bytes:
+        """Blocking read of bytes appended since the tracked offset"""
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+
+            if size < self._offset:
+                # File was truncated/rewritten, start over
+                self._offset = 0
+
+            if size == self._offset:
+                return b""
+
+            f.seek(self._offset)
+            return f.read()
+
+    async def _refresh_from_jsonl(self, log_path: str) -> None:
+        """
+        Incrementally read new JSONL entries from the tracked byte offset
+
+        Only complete lines are consumed; a partial trailing line (writer
+        mid-append) is left for the next tick.
+
+        Args:
+            log_path: Path to progress_log.jsonl
+        """
+        try:
+            data = await asyncio.to_thread(self._read_new_jsonl_bytes, log_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            return
+
+        if not data:
+            return
+
+        end = data.rfind(b"\n")
+        if end < 0:
+            return
+
+        self._offset += end + 1
+
+        new_lines = data[:end].split(b"\n")
+
+        # RichLog keeps at most max_lines; during a large catch-up, skip
+        # parsing entries that would be rotated out immediately
+        if self.max_lines and len(new_lines) > self.max_lines:
+            new_lines = new_lines[-self.max_lines:]
+
+        for line in new_lines:
+            if not line.strip():
+                continue
+            try:
+                self._write_log_entry(fastjson.loads(line))
+            except fastjson.JSONDecodeError:
+                continue
+
     def _write_log_entry(self, log_entry: Dict[str, Any]) -> None:
         """
         Format and write a single log entry
@@ -88,30 +217,26 @@ class LogViewer(RichLog):
         feature_id = log_entry.get("feature_id", "")
         status = log_entry.get("status", "")
 
-        # Format timestamp (show only time portion)
-        time_str = timestamp.split("T")[1][:8] if "T" in timestamp else timestamp[:8]
+        # Format timestamp (show only time portion; single scan, no split list)
+        idx = timestamp.find("T")
+        time_str = timestamp[idx + 1:idx + 9] if idx >= 0 else timestamp[:8]
 
         # Color-code agent names
         agent_text = self._colorize_agent(agent)
 
-        # Build log line
-        log_line = Text()
-        log_line.append(f"[{time_str}] ", style="dim")
-        log_line.append(agent_text)
-        log_line.append(" ")
-
-        # Add action with optional status coloring
-        if status:
-            action_style = self._get_status_style(status)
-            log_line.append(action, style=action_style)
-        else:
-            log_line.append(action)
+        # Build log line in a single assemble call
+        parts = [
+            (f"[{time_str}] ", "dim"),
+            agent_text,
+            " ",
+            (action, self._get_status_style(status)) if status else action,
+        ]
 
         # Add feature ID if present
         if feature_id:
-            log_line.append(f" ({feature_id})", style="dim cyan")
+            parts.append((f" ({feature_id})", "dim cyan"))
 
-        self.write(log_line)
+        self.write(Text.assemble(*parts))
 
     def _colorize_agent(self, agent: str) -> Text:
         """
@@ -121,26 +246,14 @@ class LogViewer(RichLog):
             agent: Agent name string
 
         Returns:
-            Rich Text object with color styling
+            Rich Text object with color styling (shared, do not mutate)
         """
-        agent_colors = {
-            "initializer": ("INIT", "#A78BFA"),
-            "coding": ("CODE", "#3B82F6"),
-            "testing": ("TEST", "#FFD700"),
-            "gitops": ("GIT", "#00D9A3"),
-            "qa_doc": ("QA", "#60A5FA"),
-            "system": ("SYS", "#999999"),
-            "router": ("ROUT", "#A78BFA"),
-        }
-
-        display_name, style = agent_colors.get(
-            agent.lower(),
-            (agent.upper()[:4], "#999999")
-        )
-
-        return Text(f"[{display_name}]", style=style)
-
-    def _get_status_style(self, status: str) -> str:
+        key = agent.lower()
+        return _AGENT_TEXT.get(key) or _fallback_agent_text(key)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_status_style(status: str) -> str:
         """
         Get Rich style for status keywords
 
@@ -150,16 +263,4 @@ class LogViewer(RichLog):
         Returns:
             Rich style string
         """
-        status_styles = {
-            "success": "#00D9A3",
-            "completed": "#00D9A3",
-            "done": "#00D9A3",
-            "failed": "#FF6B6B",
-            "error": "#FF6B6B",
-            "warning": "#FFD700",
-            "pending": "#666666",
-            "running": "#3B82F6",
-            "testing": "#FFD700",
-        }
-
-        return status_styles.get(status.lower(), "#ededed")
+        return _LOG_STATUS_STYLES.get(status.lower(), "#ededed")
@@ -4,14 +4,31 @@ Status Header Widget
 Displays project name, current status, and elapsed time.
 """
 
+import asyncio
 import os
-import json
 from datetime import datetime
+from functools import lru_cache
+from src.utils import fastjson
+from src.cli.components import feature_cache
 from typing import Optional
 from textual.widgets import Static
 from rich.text import Text
 
 
+# Rich style per workflow phase
+_PHASE_STYLES = {
+    "initializing": "#FFD700",
+    "planning": "#A78BFA",
+    "implementing": "#3B82F6",
+    "coding": "#3B82F6",
+    "testing": "#FFD700",
+    "completed": "#00D9A3",
+    "issues detected": "#FF6B6B",
+    "error reading state": "#FF6B6B",
+    "running": "#60A5FA",
+}
+
+
 class StatusHeader(Static):
     """
     Status header showing:
@@ -25,6 +42,13 @@ class StatusHeader(Static):
         super().__init__(**kwargs)
         self.project_name = project_name
         self.start_time = datetime.now()
+        # Path is fixed for the widget's lifetime; compute it once
+        base = os.path.join(os.getenv("OUTPUT_DIR", "./output"), project_name)
+        self._feature_path = os.path.join(base, "feature_list.json")
+        # Version of the shared feature cache last counted, so unchanged
+        # polls only re-render the elapsed time
+        self._version = None
+        self._cached_counts = ("Running", 0, 0, 0)
 
     def on_mount(self) -> None:
         """Initialize header"""
@@ -34,11 +58,7 @@ class StatusHeader(Static):
         """
         Read state files and update header
         """
-        repo_path = os.path.join(
-            os.getenv("OUTPUT_DIR", "./output"),
-            self.project_name
-        )
-        feature_path = os.path.join(repo_path, "feature_list.json")
+        feature_path = self._feature_path
 
         # Default values
         phase = "Running"
@@ -46,30 +66,51 @@ class StatusHeader(Static):
         done_features = 0
         failed_features = 0
 
-        if os.path.exists(feature_path):
-            try:
-                with open(feature_path, "r", encoding="utf-8") as f:
-                    features = json.load(f)
-
+        try:
+            # Shared cache: parses once per file change across widgets
+            features, version = await asyncio.to_thread(
+                feature_cache.load_features, feature_path
+            )
+
+            if features is not None:
+                # Re-render with cached counts (elapsed time still ticks)
+                # when the file hasn't changed
+                if version == self._version:
+                    self.update(self._render_header(*self._cached_counts))
+                    return
+                self._version = version
+
+                # Count statuses in a single pass instead of one loop per metric
                 total_features = len(features)
-                done_features = sum(1 for f in features if f.get("status") == "done")
-                failed_features = sum(1 for f in features if f.get("status") == "failed")
+                has_testing = False
+                has_coding = False
+                for feat in features:
+                    status = feat.get("status")
+                    if status == "done":
+                        done_features += 1
+                    elif status == "failed":
+                        failed_features += 1
+                    elif status == "testing":
+                        has_testing = True
+                    elif status == "coding" or status == "in_progress":
+                        has_coding = True
 
                 # Determine phase from feature statuses
                 if done_features == total_features and total_features > 0:
                     phase = "Completed"
                 elif failed_features > 0:
                     phase = "Issues Detected"
-                elif any(f.get("status") == "testing" for f in features):
+                elif has_testing:
                     phase = "Testing"
-                elif any(f.get("status") in ["coding", "in_progress"] for f in features):
+                elif has_coding:
                     phase = "Implementing"
                 else:
                     phase = "Planning"
 
-            except (json.JSONDecodeError, Exception):
-                phase = "Error Reading State"
+        except (fastjson.JSONDecodeError, Exception):
+            phase = "Error Reading State"
 
+        self._cached_counts = (phase, total_features, done_features, failed_features)
         self.update(self._render_header(phase, total_features, done_features, failed_features))
 
     def _render_header(
@@ -128,7 +169,9 @@ class StatusHeader(Static):
 
         return header
 
-    def _get_phase_style(self, phase: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_phase_style(phase: str) -> str:
         """
         Get Rich style for phase text
 
@@ -138,16 +181,4 @@ class StatusHeader(Static):
         Returns:
             Rich style string
         """
-        phase_styles = {
-            "initializing": "#FFD700",
-            "planning": "#A78BFA",
-            "implementing": "#3B82F6",
-            "coding": "#3B82F6",
-            "testing": "#FFD700",
-            "completed": "#00D9A3",
-            "issues detected": "#FF6B6B",
-            "error reading state": "#FF6B6B",
-            "running": "#60A5FA",
-        }
-
-        return phase_styles.get(phase.lower(), "#999999")
+        return _PHASE_STYLES.get(phase.lower(), "#999999")
@@ -4,15 +4,56 @@ Token Usage Chart Widget
 Displays token consumption by agent as a bar chart.
 """
 
+import asyncio
+import heapq
 import os
-import json
+from functools import lru_cache
 from typing import Dict, Any
+from src.utils import fastjson
 from textual.widgets import Static
 from rich.text import Text
 from rich.console import Group
 from rich.panel import Panel
 
 
+# Bars are at most 20 chars; slice one prebuilt string instead of
+# multiplying a fresh one per agent per render
+_FULL_BAR = "█" * 20
+
+# Bar color per agent
+_AGENT_COLORS = {
+    "initializer": "#A78BFA",
+    "coding": "#3B82F6",
+    "testing": "#FFD700",
+    "gitops": "#00D9A3",
+    "qa_doc": "#60A5FA",
+}
+
+
+def _make_panel(content) -> Panel:
+    """Wrap content in the chart's standard panel frame"""
+    return Panel(
+        content,
+        title="Tokens",
+        title_align="left",
+        border_style="#1a1a1a",
+        padding=(1, 2),
+    )
+
+
+# The empty state is rendered for every tick until tokens arrive, so the
+# Panel is built once and shared across all TokenChart instances
+_EMPTY_PANEL = _make_panel(
+    Text("Waiting for tokens...", style="#666666", justify="center")
+)
+
+
+@lru_cache(maxsize=16)
+def _error_panel(error_msg: str) -> Panel:
+    """Memoized error panel — repeated identical errors reuse one Panel"""
+    return _make_panel(Text(error_msg, style="#FF6B6B", justify="center"))
+
+
 class TokenChart(Static):
     """
     Token usage chart with bar visualization
@@ -26,59 +67,78 @@ class TokenChart(Static):
     def __init__(self, project_name: str, **kwargs):
         super().__init__(**kwargs)
         self.project_name = project_name
+        # Paths are fixed for the widget's lifetime; compute them once
+        self._repo_path = os.path.join(
+            os.getenv("OUTPUT_DIR", "./output"),
+            project_name
+        )
+        self._token_path = os.path.join(self._repo_path, "token_usage.json")
+        # Cache of the last rendered file state so unchanged polls do a
+        # single stat and skip parse + render entirely
+        self._cache_key = None
+        self._cache_panel = None
+        # Memoized render, keyed on the aggregated data itself — file
+        # rewrites with identical stats reuse the previous Panel
+        self._last_sig = None
+        self._last_panel = None
+        # Panel currently shown; update() is skipped when unchanged so
+        # idle ticks never re-enter Textual's layout/paint pipeline
+        self._displayed_panel = None
 
     def on_mount(self) -> None:
         """Initialize chart"""
-        self.update(self._render_empty_state())
+        self._show(self._render_empty_state())
+
+    def _show(self, panel: Panel) -> None:
+        """Push a panel to the widget unless it is already displayed"""
+        if panel is not self._displayed_panel:
+            self._displayed_panel = panel
+            self.update(panel)
 
     async def refresh_from_disk(self) -> None:
         """
         Read token_usage.json and update chart
         """
-        repo_path = os.path.join(
-            os.getenv("OUTPUT_DIR", "./output"),
-            self.project_name
-        )
-        token_path = os.path.join(repo_path, "token_usage.json")
+        repo_path = self._repo_path
+        token_path = self._token_path
 
-        if not os.path.exists(token_path):
-            self.update(self._render_empty_state())
+        try:
+            # One stat decides both existence and cache validity (no
+            # separate exists() syscall)
+            st = os.stat(token_path)
+        except FileNotFoundError:
+            self._show(self._render_empty_state())
             return
 
         try:
-            # Use get_token_stats to process raw log entries into aggregated stats
+            # Skip parse + render entirely when the file hasn't changed
+            key = (st.st_mtime_ns, st.st_size)
+            if key == self._cache_key:
+                return
+
+            # Use get_token_stats to process raw log entries into aggregated
+            # stats; run it in a worker thread so the blocking read + parse
+            # doesn't stall the Textual event loop
             from src.utils.token_counter import get_token_stats
-            token_data = get_token_stats(repo_path)
+            token_data = await asyncio.to_thread(get_token_stats, repo_path)
 
             # Render chart with aggregated data
-            self.update(self._render_chart(token_data))
+            self._cache_panel = self._render_chart(token_data)
+            self._cache_key = key
+            self._show(self._cache_panel)
 
-        except json.JSONDecodeError:
-            self.update(self._render_error("Failed to parse token_usage.json"))
+        except fastjson.JSONDecodeError:
+            self._show(self._render_error("Failed to parse token_usage.json"))
         except Exception as e:
-            self.update(self._render_error(f"Error: {str(e)[:40]}"))
+            self._show(self._render_error(f"Error: {str(e)[:40]}"))
 
     def _render_empty_state(self) -> Panel:
         """Render empty state when no data available"""
-        content = Text("Waiting for tokens...", style="#666666", justify="center")
-        return Panel(
-            content,
-            title="Tokens",
-            title_align="left",
-            border_style="#1a1a1a",
-            padding=(1, 2),
-        )
+        return _EMPTY_PANEL
 
     def _render_error(self, error_msg: str) -> Panel:
         """Render error state"""
-        content = Text(error_msg, style="#FF6B6B", justify="center")
-        return Panel(
-            content,
-            title="Tokens",
-            title_align="left",
-            border_style="#1a1a1a",
-            padding=(1, 2),
-        )
+        return _error_panel(error_msg)
 
     def _render_chart(self, token_data: Dict[str, Any]) -> Panel:
         """
@@ -93,6 +153,11 @@ class TokenChart(Static):
         total_tokens = token_data.get("total_tokens", 0)
         by_agent = token_data.get("by_agent", {})
 
+        # Reuse the memoized Panel when the aggregated data is unchanged
+        sig = (total_tokens, tuple(sorted(by_agent.items())))
+        if sig == self._last_sig:
+            return self._last_panel
+
         # Create chart lines
         lines = []
 
@@ -106,31 +171,32 @@ class TokenChart(Static):
             # Calculate max tokens for scaling
             max_tokens = max(by_agent.values()) if by_agent else 1
 
-            # Sort agents by token usage (descending)
-            sorted_agents = sorted(
+            # Order agents by token usage (descending); nlargest beats a
+            # full sort for the handful of agents involved
+            sorted_agents = heapq.nlargest(
+                len(by_agent),
                 by_agent.items(),
-                key=lambda x: x[1],
-                reverse=True
+                key=lambda x: x[1]
             )
 
-            # Render bar for each agent
+            # Render bar for each agent (label + color computed once here
+            # rather than per _render_bar call)
             for agent, tokens in sorted_agents:
-                lines.append(self._render_bar(agent, tokens, max_tokens, total_tokens))
+                label = f"{agent.upper()[:8]:<8} "
+                color = _AGENT_COLORS.get(agent.lower(), "#999999")
+                lines.append(self._render_bar(label, color, tokens, max_tokens, total_tokens))
 
         # Group all lines
-        content = Group(*lines)
-
-        return Panel(
-            content,
-            title="Tokens",
-            title_align="left",
-            border_style="#1a1a1a",
-            padding=(1, 2),
-        )
+        panel = _make_panel(Group(*lines))
+
+        self._last_sig = sig
+        self._last_panel = panel
+        return panel
 
     def _render_bar(
         self,
-        agent: str,
+        label: str,
+        color: str,
         tokens: int,
         max_tokens: int,
         total_tokens: int
@@ -139,7 +205,8 @@ class TokenChart(Static):
         Render a single bar for an agent
 
         Args:
-            agent: Agent name
+            label: Pre-formatted agent label (padded to 8 chars)
+            color: Bar color for this agent
             tokens: Tokens consumed by this agent
             max_tokens: Maximum tokens (for scaling)
             total_tokens: Total tokens across all agents
@@ -154,20 +221,10 @@ class TokenChart(Static):
         # Calculate percentage
         percentage = (tokens / total_tokens * 100) if total_tokens > 0 else 0
 
-        # Color-code agent bars
-        agent_colors = {
-            "initializer": "#A78BFA",
-            "coding": "#3B82F6",
-            "testing": "#FFD700",
-            "gitops": "#00D9A3",
-            "qa_doc": "#60A5FA",
-        }
-        color = agent_colors.get(agent.lower(), "#999999")
-
         # Build bar line
         line = Text()
-        line.append(f"{agent.upper()[:8]:<8} ", style="#ededed")
-        line.append("" * bar_width, style=color)
+        line.append(label, style="#ededed")
+        line.append(_FULL_BAR[:bar_width], style=color)
         line.append(f" {tokens:,} ({percentage:.1f}%)", style="#666666")
 
         return line
@@ -8,10 +8,10 @@ import asyncio
 import os
 import logging
 from typing import Optional
-from src.workflow.orchestrator import create_workflow
-from src.checkpointing.factory import CheckpointerFactory
-from src.state.schemas import AppBuilderState
-from langchain_core.messages import HumanMessage
+
+# The langchain/langgraph stack (orchestrator, checkpointer, messages)
+# is imported lazily inside _run — pulling it in at module import time
+# adds hundreds of ms to CLI startup before the user even presses Start.
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,29 +25,45 @@ class WorkflowRunner:
     Does NOT modify orchestrator logic.
     """
 
-    _pause_flag = asyncio.Event()
-    _running = False
-    _task: Optional[asyncio.Task] = None
-    _error: Optional[Exception] = None
-    _should_stop = False
+    # The CLI drives a single active runner through the classmethods below;
+    # per-runner state lives on the instance so a second workflow doesn't
+    # stomp the first
+    _current: Optional["WorkflowRunner"] = None
+
+    # Compiled workflow app, cached across runs — graph construction and
+    # compile are pure given the same checkpointer, so restarts reuse it
+    _cached_app = None
+    _cached_checkpointer_id: Optional[int] = None
 
     def __init__(self, project_name: str, description: str, screen):
         self.project_name = project_name
         self.description = description
         self.screen = screen  # MainScreen reference for callbacks
-        WorkflowRunner._pause_flag.set()  # Not paused initially
-        WorkflowRunner._should_stop = False
+        self.repo_path = os.path.join(os.getenv("OUTPUT_DIR", "./output"), project_name)
+        self._pause_flag = asyncio.Event()
+        self._pause_flag.set()  # Not paused initially
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+        self._should_stop = False
+        WorkflowRunner._current = self
 
     async def start(self):
         """Start workflow in background task"""
-        WorkflowRunner._task = asyncio.create_task(self._run())
+        self._task = asyncio.create_task(self._run())
 
     async def _run(self):
         """
         Run workflow (identical to main.py logic) with error handling
         """
-        WorkflowRunner._running = True
-        WorkflowRunner._error = None
+        # Deferred imports — see module docstring note on CLI startup cost
+        from src.workflow.orchestrator import create_workflow
+        from src.checkpointing.factory import CheckpointerFactory
+        from src.state.schemas import AppBuilderState
+        from langchain_core.messages import HumanMessage
+
+        self._running = True
+        self._error = None
 
         try:
             # Create workflow (same as main.py)
@@ -60,15 +76,25 @@ class WorkflowRunner:
                 logger.warning(f"   (State won't persist between runs)")
                 checkpointer = None  # Run without checkpointer
 
-            workflow = await create_workflow()
-
-            if checkpointer:
-                app = workflow.compile(checkpointer=checkpointer)
+            # Reuse the compiled app from a previous run with the same
+            # checkpointer (pause/resume restarts, warm second runs)
+            ck_id = id(checkpointer) if checkpointer else 0
+            if (WorkflowRunner._cached_app is not None
+                    and WorkflowRunner._cached_checkpointer_id == ck_id):
+                app = WorkflowRunner._cached_app
             else:
-                app = workflow.compile()  # No checkpointer
+                workflow = await create_workflow()
+
+                if checkpointer:
+                    app = workflow.compile(checkpointer=checkpointer)
+                else:
+                    app = workflow.compile()  # No checkpointer
+
+                WorkflowRunner._cached_app = app
+                WorkflowRunner._cached_checkpointer_id = ck_id
 
             # Initialize state (same as main.py)
-            repo_path = os.path.join(os.getenv("OUTPUT_DIR", "./output"), self.project_name)
+            repo_path = self.repo_path
 
             # Config with or without checkpointing
             if checkpointer:
@@ -82,8 +108,10 @@ class WorkflowRunner:
                     "recursion_limit": 150
                 }
 
-            # Create repo directory if it doesn't exist
-            os.makedirs(repo_path, exist_ok=True)
+            # Create repo directory if it doesn't exist (isdir check first
+            # so restarts skip the makedirs syscall chain)
+            if not os.path.isdir(repo_path):
+                os.makedirs(repo_path, exist_ok=True)
 
             # Initialize state (same structure as main.py)
             initial_state: AppBuilderState = {
@@ -129,15 +157,20 @@ class WorkflowRunner:
 
             async for chunk in app.astream(initial_state, config):
                 chunk_count += 1
-                logger.info(f"[CHUNK] Chunk {chunk_count}: {list(chunk.keys())}")
+                # Level check up front so the keys list and format string
+                # aren't built per chunk when INFO logging is off
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("[CHUNK] Chunk %d: %s", chunk_count, list(chunk.keys()))
 
                 # Check if stop requested
-                if WorkflowRunner._should_stop:
+                if self._should_stop:
                     logger.info("Workflow stop requested, exiting gracefully")
                     break
 
-                # Check pause flag
-                await WorkflowRunner._pause_flag.wait()
+                # Check pause flag — is_set() is a plain bool check, so the
+                # unpaused common case skips an await scheduler round-trip
+                if not self._pause_flag.is_set():
+                    await self._pause_flag.wait()
 
                 # Chunks automatically update disk files
                 # CLI polls files for UI updates (decoupled)
@@ -146,65 +179,67 @@ class WorkflowRunner:
 
         except asyncio.CancelledError:
             logger.info("Workflow task cancelled, shutting down gracefully")
-            WorkflowRunner._error = None
+            self._error = None
         except Exception as e:
             logger.error(f"Workflow error: {e}", exc_info=True)
-            WorkflowRunner._error = e
+            self._error = e
         finally:
-            WorkflowRunner._running = False
+            self._running = False
 
     @classmethod
     def pause(cls):
         """Pause workflow execution"""
-        cls._pause_flag.clear()
+        if cls._current:
+            cls._current._pause_flag.clear()
         logger.info("Workflow paused")
 
     @classmethod
     def resume(cls):
         """Resume workflow execution"""
-        cls._pause_flag.set()
+        if cls._current:
+            cls._current._pause_flag.set()
         logger.info("Workflow resumed")
 
     @classmethod
     def is_running(cls) -> bool:
-        """Check if workflow is running"""
-        return cls._running
+        """Check if the active workflow is running"""
+        return cls._current is not None and cls._current._running
 
     @classmethod
     def get_error(cls) -> Optional[Exception]:
-        """Get the last error that occurred"""
-        return cls._error
+        """Get the last error from the active workflow"""
+        return cls._current._error if cls._current else None
 
     @classmethod
     async def stop(cls):
         """
-        Stop workflow gracefully
+        Stop the active workflow gracefully
 
         Signals the workflow to stop and waits for it to finish.
         """
+        runner = cls._current
+        if runner is None:
+            return
+
         logger.info("Requesting workflow stop")
-        cls._should_stop = True
+        runner._should_stop = True
 
-        if cls._task and not cls._task.done():
+        if runner._task and not runner._task.done():
             try:
                 # Give workflow 5 seconds to stop gracefully
-                await asyncio.wait_for(cls._task, timeout=5.0)
+                await asyncio.wait_for(runner._task, timeout=5.0)
             except asyncio.TimeoutError:
                 logger.warning("Workflow didn't stop gracefully, cancelling task")
-                cls._task.cancel()
+                runner._task.cancel()
                 try:
-                    await cls._task
+                    await runner._task
                 except asyncio.CancelledError:
                     pass
 
-        cls._running = False
+        runner._running = False
         logger.info("Workflow stopped")
 
     @classmethod
     def reset(cls):
-        """Reset workflow runner state"""
-        cls._running = False
-        cls._task = None
-        cls._error = None
-        cls._should_stop = False
-        cls._pause_flag.set()
+        """Detach the active workflow runner"""
+        cls._current = None
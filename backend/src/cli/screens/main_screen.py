@@ -4,12 +4,57 @@ Main Dashboard Screen
 Shows live feature board, logs, and token usage.
 """
 
+import asyncio
+import os
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.widgets import Header, Footer
 from src.cli.runner.workflow_runner import WorkflowRunner
 from src.cli.components import FeatureTable, LogViewer, TokenChart, StatusHeader
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+# State files the dashboard cares about
+_WATCHED_FILES = {
+    "feature_list.json",
+    "progress_log.json",
+    "progress_log.jsonl",
+    "token_usage.json",
+}
+
+
+class _RepoChangeHandler(FileSystemEventHandler):
+    """
+    Bridges watchdog's worker thread to the Textual event loop
+
+    Fires a dashboard refresh only when one of the watched state files
+    changes, so the UI is idle between real workflow updates.
+    """
+
+    def __init__(self, screen: "MainScreen"):
+        self._screen = screen
+
+    def on_modified(self, event) -> None:
+        self._notify(event)
+
+    def on_created(self, event) -> None:
+        self._notify(event)
+
+    def _notify(self, event) -> None:
+        if event.is_directory:
+            return
+        if os.path.basename(str(event.src_path)) not in _WATCHED_FILES:
+            return
+        self._screen.app.call_from_thread(self._screen.schedule_refresh)
+
 
 class MainScreen(Screen):
     """
@@ -96,6 +141,13 @@ class MainScreen(Screen):
         self.project_name = project_name
         self.description = description
         self.workflow_runner = None
+        self._observer = None
+        # Adaptive polling state: back off when the workflow goes idle
+        self._timer = None
+        self._poll_callback = None
+        self._poll_interval = 0.5
+        self._idle_ticks = 0
+        self._heartbeats = 0
 
     def compose(self):
         """Compose the main screen layout with all widgets"""
@@ -146,30 +198,96 @@ class MainScreen(Screen):
         )
         await self.workflow_runner.start()
 
-        # Start periodic UI updates (every 500ms)
-        self.set_interval(0.5, self.update_ui)
+        if WATCHDOG_AVAILABLE:
+            # Event-driven updates: the interval only keeps the elapsed-time
+            # clock ticking and retries attaching the observer until the
+            # repo directory exists; file changes drive the real refreshes
+            self._poll_callback = self._tick
+        else:
+            # Fall back to periodic UI updates (every 500ms)
+            self._poll_callback = self.update_ui
+
+        self._timer = self.set_interval(self._poll_interval, self._poll_callback)
+
+    async def _tick(self):
+        """Heartbeat used when watchdog drives the refreshes"""
+        if self._observer is None:
+            self._start_observer()
+            # Behave like polling until the observer is attached
+            await self.update_ui()
+            return
+
+        # Safety net: do a full refresh every ~5s in case a file event was
+        # dropped (editor replaces, network filesystems, etc.)
+        self._heartbeats += 1
+        if self._heartbeats % 10 == 0:
+            await self.update_ui()
+            return
 
-    async def update_ui(self):
-        """
-        Periodic UI update (called every 500ms)
-        Reads state from disk and updates all widgets
-        """
         try:
-            # Update status header
             status_header = self.query_one("#status_header_widget", StatusHeader)
             await status_header.refresh_from_disk()
+        except Exception:
+            pass
 
-            # Update feature table
-            feature_table = self.query_one("#feature_table", FeatureTable)
-            await feature_table.refresh_from_disk()
+    def _start_observer(self) -> None:
+        """Attach a watchdog observer to the project repo directory"""
+        repo_path = os.path.join(
+            os.getenv("OUTPUT_DIR", "./output"),
+            self.project_name
+        )
+        if not os.path.isdir(repo_path):
+            return
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_RepoChangeHandler(self), repo_path, recursive=False)
+        observer.start()
+        self._observer = observer
+
+    def _set_poll_interval(self, interval: float) -> None:
+        """Restart the poll timer at a new cadence (no-op if unchanged)"""
+        if self._timer is None or interval == self._poll_interval:
+            return
+        self._timer.stop()
+        self._poll_interval = interval
+        self._timer = self.set_interval(interval, self._poll_callback)
+
+    def _adapt_poll_rate(self) -> None:
+        """
+        Back off to a slow cadence after sustained idle ticks
 
-            # Update log viewer
-            log_viewer = self.query_one("#log_viewer", LogViewer)
-            await log_viewer.refresh_from_disk()
+        Fast 500ms polling only matters while the workflow is producing
+        updates; once it stops, drop to 3s to cut idle syscalls, and snap
+        back to 500ms as soon as the workflow runs again.
+        """
+        if WorkflowRunner.is_running():
+            self._idle_ticks = 0
+            self._set_poll_interval(0.5)
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks >= 10:
+                self._set_poll_interval(3.0)
+
+    def schedule_refresh(self) -> None:
+        """Schedule a dashboard refresh (called from the watchdog thread)"""
+        self.run_worker(self.update_ui(), exclusive=True)
 
-            # Update token chart
-            token_chart = self.query_one("#token_chart", TokenChart)
-            await token_chart.refresh_from_disk()
+    async def update_ui(self):
+        """
+        Periodic UI update (called every 500ms)
+        Reads state from disk and updates all widgets
+        """
+        try:
+            # Refresh all widgets concurrently — the reads are independent,
+            # so their disk latency overlaps instead of serializing
+            await asyncio.gather(
+                self.query_one("#status_header_widget", StatusHeader).refresh_from_disk(),
+                self.query_one("#feature_table", FeatureTable).refresh_from_disk(),
+                self.query_one("#log_viewer", LogViewer).refresh_from_disk(),
+                self.query_one("#token_chart", TokenChart).refresh_from_disk(),
+                return_exceptions=True
+            )
 
             # Check for workflow errors
             error = WorkflowRunner.get_error()
@@ -185,8 +303,14 @@ class MainScreen(Screen):
             # Errors will be visible in the log viewer
             pass
 
+        self._adapt_poll_rate()
+
     async def on_unmount(self) -> None:
         """Clean up when screen is closed"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
         # Stop workflow if still running
         if self.workflow_runner and WorkflowRunner.is_running():
             await WorkflowRunner.stop()
@@ -4,6 +4,8 @@ Setup Screen for Project Configuration
 Initial screen that collects project name and description from user.
 """
 
+import re
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Vertical, Horizontal
@@ -12,6 +14,10 @@ from textual import on
 from textual.validation import Function, ValidationResult, Validator
 
 
+# Valid project names: alphanumeric, hyphens, underscores
+_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
 class ProjectNameValidator(Validator):
     """Validator for project names"""
 
@@ -20,8 +26,9 @@ class ProjectNameValidator(Validator):
         if not value:
             return self.failure("Project name is required")
 
-        # Check for valid characters (alphanumeric, hyphens, underscores)
-        if not all(c.isalnum() or c in ('-', '_') for c in value):
+        # Check for valid characters (runs on every keystroke, so use one
+        # compiled-regex match rather than a per-character Python loop)
+        if not _NAME_RE.fullmatch(value):
             return self.failure("Only alphanumeric, hyphens, and underscores allowed")
 
         if len(value) < 3:
@@ -11,9 +11,20 @@ Compatible with:
 - langchain-mcp-adapters 0.1.0+ (March 2025)
 """
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from __future__ import annotations
+
 import os
-from typing import Any, Optional
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
+
+# Clients and their tool lists are cached per project path — each client
+# spawns npx/python MCP server subprocesses, so reuse avoids paying the
+# process startup + handshake cost on every call
+_client_cache: dict[str, "MultiServerMCPClient"] = {}
+_tools_cache: dict[str, list] = {}
 
 
 async def create_mcp_client(project_path: Optional[str] = None) -> MultiServerMCPClient:
@@ -34,9 +45,17 @@ async def create_mcp_client(project_path: Optional[str] = None) -> MultiServerMC
         >>> tools = await client.get_tools()
         >>> agent = create_agent(model, tools=tools)
     """
+    # Deferred so importing this module stays cheap (fast CLI startup);
+    # the adapter stack only loads when a client is actually built
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
     if project_path is None:
         project_path = os.getenv("OUTPUT_DIR", "./output")
 
+    cached = _client_cache.get(project_path)
+    if cached is not None:
+        return cached
+
     github_token = os.getenv("GITHUB_TOKEN")
 
     config: dict[str, Any] = {}
@@ -72,15 +91,19 @@ async def create_mcp_client(project_path: Optional[str] = None) -> MultiServerMC
     try:
         client = MultiServerMCPClient(config)
         print(f"[OK] MCP client initialized with {len(config)} servers")
-        return client
     except Exception as e:
         print(f"[FAIL] Failed to initialize MCP client: {e}")
-        # Fallback to filesystem only
+        # Fallback to filesystem only — deliberately not cached, so a
+        # transient init failure doesn't pin the process to the reduced
+        # server set; the next call retries the full config
         print("   Falling back to filesystem-only MCP client")
         return MultiServerMCPClient({
             "filesystem": config["filesystem"]
         })
 
+    _client_cache[project_path] = client
+    return client
+
 
 async def get_mcp_tools(project_path: Optional[str] = None) -> list:
     """
@@ -104,10 +127,21 @@ async def get_mcp_tools(project_path: Optional[str] = None) -> list:
         print("   Using custom tools only...")
         return []
 
+    # Tools are static per server config — reuse the already-loaded list
+    key = project_path or os.getenv("OUTPUT_DIR", "./output")
+    cached = _tools_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         client = await create_mcp_client(project_path)
         tools = await client.get_tools()
         print(f"[SETUP] Loaded {len(tools)} tools from MCP servers")
+        # Only memoize tools from a cached (full-config) client; a
+        # filesystem-only fallback's reduced list shouldn't outlive
+        # the call that got it
+        if _client_cache.get(key) is client:
+            _tools_cache[key] = tools
         return tools
     except Exception as e:
         print(f"[WARN]  MCP tools failed to load: {type(e).__name__}")
@@ -65,6 +65,18 @@ class TestContext(TypedDict):
     last_result: Optional[dict]  # Detailed result of last test run
 
 
+# Checkpoints serialize the full state to PostgreSQL on every chunk, so
+# the in-state progress log is capped — the complete history lives in
+# progress_log.jsonl on disk
+PROGRESS_LOG_MAX = 100
+
+
+def keep_recent_progress(existing: list, new: list) -> list:
+    """Reducer that appends progress entries, keeping only the most recent"""
+    combined = list(existing or []) + list(new or [])
+    return combined[-PROGRESS_LOG_MAX:]
+
+
 # Progress log entry
 class ProgressLogEntry(TypedDict):
     """Individual progress log entry"""
@@ -129,8 +141,8 @@ class AppBuilderState(TypedDict):
     # Scripts and paths
     init_script_path: Optional[str]
 
-    # Progress tracking
-    progress_log: list[ProgressLogEntry]
+    # Progress tracking (bounded — full history is on disk)
+    progress_log: Annotated[list[ProgressLogEntry], keep_recent_progress]
 
 
 # Export all schemas
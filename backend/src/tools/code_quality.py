@@ -10,51 +10,330 @@ Compatible with LangChain 1.0 create_agent pattern
 """
 
 from langchain_core.tools import tool
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from src.tools.recovery_tools import _ensure_gitignore_entry
 
-@tool
-def run_ruff_check(
+
+def _tool_version(tool: str) -> str:
+    """Get a tool's version string (cached — it can't change mid-run)"""
+    version = _TOOL_VERSIONS.get(tool)
+    if version is None:
+        try:
+            version = subprocess.check_output(
+                [tool, "--version"], text=True
+            ).strip()
+        except Exception:
+            version = "unknown"
+        _TOOL_VERSIONS[tool] = version
+    return version
+
+
+_TOOL_VERSIONS: dict[str, str] = {}
+
+# Repos where a mypy daemon has been started (stopped again at exit so
+# no orphan daemons are left in generated project directories)
+_DMYPY_AVAILABLE: Optional[bool] = None
+_DMYPY_REPOS: set[str] = set()
+
+
+def _dmypy_available() -> bool:
+    """Whether the mypy daemon client is installed (checked once)"""
+    global _DMYPY_AVAILABLE
+    if _DMYPY_AVAILABLE is None:
+        _DMYPY_AVAILABLE = shutil.which("dmypy") is not None
+    return _DMYPY_AVAILABLE
+
+
+def _stop_dmypy_daemons() -> None:
+    """Shut down any daemons started in checked repos (atexit)"""
+    for repo_path in _DMYPY_REPOS:
+        try:
+            subprocess.run(
+                ["dmypy", "stop"],
+                cwd=repo_path,
+                capture_output=True,
+                timeout=10
+            )
+        except Exception:
+            continue
+
+
+atexit.register(_stop_dmypy_daemons)
+
+
+class _QualityCache:
+    """
+    Content-hash result cache for a quality tool
+
+    Results are keyed by SHA256 of the checked files' contents plus the
+    tool version, so unchanged files skip the subprocess entirely.
+    Persisted under {repo_path}/.quality_cache/{tool}.json; written once
+    at interpreter exit rather than per call.
+    """
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self._caches: dict[str, dict] = {}  # repo_path -> {key: result}
+        self._dirty: set[str] = set()
+
+    def _cache_file(self, repo_path: str) -> str:
+        return os.path.join(repo_path, ".quality_cache", f"{self.tool}.json")
+
+    def _cache_for(self, repo_path: str) -> dict:
+        cache = self._caches.get(repo_path)
+        if cache is None:
+            try:
+                with open(self._cache_file(repo_path), "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                cache = {}
+            self._caches[repo_path] = cache
+        return cache
+
+    def key(
+        self,
+        repo_path: str,
+        file_paths: Optional[list[str]],
+        config_flags: tuple = ()
+    ) -> Optional[str]:
+        """Fingerprint of tool version + config + file contents (None = uncacheable)"""
+        if not file_paths:
+            # Whole-repo checks aren't worth hashing every file for
+            return None
+
+        h = hashlib.sha256(_tool_version(self.tool).encode())
+        # The verdict depends on the active config as much as the code:
+        # hashing the resolved flags and the config file's contents means
+        # a ruff.toml/pyproject.toml created or edited mid-run invalidates
+        # results cached under the old config.
+        for flag in config_flags:
+            h.update(flag.encode())
+            if os.path.isfile(flag):
+                try:
+                    with open(flag, "rb") as f:
+                        h.update(hashlib.sha256(f.read()).digest())
+                except OSError:
+                    return None
+        for path in sorted(file_paths):
+            abs_path = path if os.path.isabs(path) else os.path.join(repo_path, path)
+            try:
+                with open(abs_path, "rb") as f:
+                    h.update(path.encode())
+                    h.update(hashlib.sha256(f.read()).digest())
+            except OSError:
+                return None
+        return h.hexdigest()
+
+    def get(self, repo_path: str, key: Optional[str]) -> Optional[dict]:
+        if key is None:
+            return None
+        return self._cache_for(repo_path).get(key)
+
+    def put(self, repo_path: str, key: Optional[str], result: dict) -> None:
+        if key is None:
+            return
+        self._cache_for(repo_path)[key] = result
+        self._dirty.add(repo_path)
+
+    def flush(self) -> None:
+        """Persist dirty caches (registered with atexit)"""
+        for repo_path in self._dirty:
+            cache_file = self._cache_file(repo_path)
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump(self._caches[repo_path], f)
+                # Keep the cache out of the generated project's commits,
+                # same as pending_ops.json
+                _ensure_gitignore_entry(repo_path, ".quality_cache/")
+            except OSError:
+                continue
+        self._dirty.clear()
+
+
+# Only ruff gets a content-hash cache: ruff diagnostics depend solely on
+# the checked file's own contents, so the key is sound. mypy results also
+# depend on every module the file imports — a stale hit after editing a
+# dependency would hide new type errors — so mypy relies on the daemon
+# (dmypy) for its incremental speedup instead.
+_RUFF_CACHE = _QualityCache("ruff")
+atexit.register(_RUFF_CACHE.flush)
+
+def _checks_fingerprint(
     repo_path: str,
-    file_paths: Optional[list[str]] = None
-) -> dict:
+    changed_files: Optional[list[str]]
+) -> Optional[str]:
     """
-    Run ruff linter on Python code
+    Fingerprint for a combined-check invocation (None = uncacheable)
 
-    Args:
-        repo_path: Path to repository
-        file_paths: Optional list of specific files to check
+    Combines git HEAD, the working-tree status, and the mtimes of both
+    the changed files and every path git reports dirty — porcelain says
+    *which* files are modified, not what they contain, so without the
+    mtimes a second edit to an already-dirty file would not invalidate.
+    """
+    try:
+        head_proc = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "HEAD"],
+            capture_output=True, text=True
+        )
+        if head_proc.returncode != 0:
+            # Not a git repo (or no commits yet) — no reliable
+            # invalidation signal, so don't memoize at all
+            return None
+        status_proc = subprocess.run(
+            ["git", "-C", repo_path, "status", "--porcelain"],
+            capture_output=True, text=True
+        )
+        if status_proc.returncode != 0:
+            return None
+    except Exception:
+        return None
 
-    Returns:
-        Lint results dictionary
+    status = status_proc.stdout
+    parts = [repo_path, head_proc.stdout.strip(),
+             hashlib.sha256(status.encode()).hexdigest()]
 
-    Example:
-        >>> run_ruff_check("/path/to/repo")
-        {"passed": True, "issues_found": 0, "output": "..."}
+    # Paths git reports dirty (XY <path>, renames as "old -> new")
+    dirty_paths = set()
+    for line in status.splitlines():
+        path = line[3:]
+        if " -> " in path:
+            path = path.rsplit(" -> ", 1)[1]
+        dirty_paths.add(path.strip('"'))
+
+    for path in sorted(dirty_paths.union(changed_files or ())):
+        abs_path = path if os.path.isabs(path) else os.path.join(repo_path, path)
+        try:
+            parts.append(f"{path}:{os.stat(abs_path).st_mtime_ns}")
+        except OSError:
+            # Deleted (or unreadable) — still distinguish it from the
+            # same path existing with some mtime
+            parts.append(f"{path}:gone")
+    return "|".join(parts)
+
+
+# mypy reports larger than this are counted via mmap and truncated to a
+# preview instead of being materialized as one giant string
+_MYPY_OUTPUT_THRESHOLD = 1024 * 1024
+
+# Combined-check memo keyed by the fingerprint above (FIFO-bounded)
+_ALL_CHECKS_CACHE: dict[str, dict] = {}
+_ALL_CHECKS_CACHE_MAX = 64
+
+
+# One long-lived worker pool for the combined check — the agent invokes
+# quality checks repeatedly, so thread spawn/teardown is paid once
+_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="quality")
+atexit.register(_CHECK_EXECUTOR.shutdown, wait=False)
+
+
+def _ruff_config_flags(repo_path: str) -> tuple:
+    """
+    Explicit config flags so ruff skips ancestor config discovery
+
+    Two stats here replace ruff's walk up the directory tree; --isolated
+    skips discovery entirely when the repo has no config. Not cached —
+    the coding agent may create a config mid-run.
     """
+    for name in ("ruff.toml", "pyproject.toml"):
+        config = os.path.join(repo_path, name)
+        if os.path.isfile(config):
+            return ("--config", config)
+    return ("--isolated",)
+
+
+def _count_ruff_issues(stdout: bytes) -> int:
+    """Exact issue count from ruff's JSON report (one object per issue)"""
     try:
-        cmd = ["ruff", "check"]
-        if file_paths:
-            cmd.extend(file_paths)
+        return len(json.loads(stdout or b"[]"))
+    except json.JSONDecodeError:
+        # Unexpected non-JSON output — fall back to line counting
+        return stdout.count(b"\n") if stdout else 0
+
+
+def _count_mypy_issues(stdout: bytes) -> int:
+    """Exact error count from mypy's line-delimited JSON report"""
+    count = 0
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            # Non-JSON line (dmypy, old mypy, or summary text) — fall back
+            return stdout.count(b"error:")
+        if entry.get("severity", "error") == "error":
+            count += 1
+    return count
+
+
+def _ruff_check(
+    repo_path: str,
+    file_paths: Optional[list[str]] = None
+) -> dict:
+    """Run ruff and return the results dict (core shared by the tools)"""
+    config_flags = _ruff_config_flags(repo_path)
+    cache_key = _RUFF_CACHE.key(repo_path, file_paths, config_flags)
+    cached = _RUFF_CACHE.get(repo_path, cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        stdin_content = None
+        cmd = [
+            "ruff", "check", "--no-fix", "--force-exclude",
+            "--output-format=json", *config_flags
+        ]
+
+        if file_paths and len(file_paths) == 1:
+            # Single-file case (the agent's hot loop): pipe the content on
+            # stdin so ruff skips its filesystem walk and per-file opens
+            path = file_paths[0]
+            abs_path = path if os.path.isabs(path) else os.path.join(repo_path, path)
+            try:
+                with open(abs_path, "rb") as f:
+                    stdin_content = f.read()
+                cmd.extend(["-", "--stdin-filename", path])
+            except OSError:
+                # Unreadable from here — let ruff resolve the path itself
+                cmd.extend(file_paths)
+        elif file_paths:
+            # Dedupe while preserving order — the agent sometimes repeats
+            # paths in changed_files, and each duplicate costs ruff an
+            # extra open + parse
+            cmd.extend(dict.fromkeys(file_paths))
         else:
             cmd.append(".")
 
+        # Capture bytes: the issue count works directly on the raw buffer
+        # (json.loads accepts bytes), so only one decode happens — for the
+        # "output" field the agent reads
         result = subprocess.run(
             cmd,
             cwd=repo_path,
             capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace"  # Replace invalid chars instead of crashing
+            input=stdin_content
         )
 
-        return {
+        results = {
             "passed": result.returncode == 0,
-            "issues_found": result.stdout.count("\n") if result.stdout else 0,
-            "output": result.stdout,
-            "errors": result.stderr
+            "issues_found": _count_ruff_issues(result.stdout),
+            "output": result.stdout.decode("utf-8", "replace"),
+            "errors": result.stderr.decode("utf-8", "replace")
         }
+        _RUFF_CACHE.put(repo_path, cache_key, results)
+        return results
 
     except FileNotFoundError:
         return {
@@ -72,47 +351,57 @@ def run_ruff_check(
         }
 
 
-@tool
-def run_mypy_check(
+def _mypy_check(
     repo_path: str,
     file_paths: Optional[list[str]] = None
 ) -> dict:
-    """
-    Run mypy type checker on Python code
-
-    Args:
-        repo_path: Path to repository
-        file_paths: Optional list of specific files to check
-
-    Returns:
-        Type check results dictionary
-
-    Example:
-        >>> run_mypy_check("/path/to/repo")
-        {"passed": True, "issues_found": 0, "output": "..."}
-    """
+    """Run mypy and return the results dict (core shared by the tools)"""
     try:
-        cmd = ["mypy"]
+        if _dmypy_available():
+            # The daemon keeps the parsed ASTs and import graph resident,
+            # so warm re-checks skip mypy's dominant startup cost. dmypy
+            # has no JSON output; the issue counter falls back to its
+            # text scan for this path.
+            cmd = ["dmypy", "run", "--"]
+            _DMYPY_REPOS.add(repo_path)
+        else:
+            cmd = ["mypy", "--output=json"]
         if file_paths:
             cmd.extend(file_paths)
         else:
             cmd.append(".")
 
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace"  # Replace invalid chars instead of crashing
-        )
+        # Stdout goes to a temp file rather than a pipe buffer; reports
+        # beyond the threshold are counted via mmap + bytes.count and only
+        # a preview is decoded, so memory stays constant however large
+        # the output gets
+        with tempfile.TemporaryFile() as tf:
+            result = subprocess.run(
+                cmd,
+                cwd=repo_path,
+                stdout=tf,
+                stderr=subprocess.PIPE
+            )
+            size = tf.seek(0, os.SEEK_END)
 
-        return {
+            if size > _MYPY_OUTPUT_THRESHOLD:
+                with mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    issues_found = m.count(b"error:")
+                    preview = m[:8192].decode("utf-8", "replace")
+                output = preview + "\n... (output truncated)"
+            else:
+                tf.seek(0)
+                raw = tf.read()
+                issues_found = _count_mypy_issues(raw)
+                output = raw.decode("utf-8", "replace")
+
+        results = {
             "passed": result.returncode == 0,
-            "issues_found": result.stdout.count("error:"),
-            "output": result.stdout,
-            "errors": result.stderr
+            "issues_found": issues_found,
+            "output": output,
+            "errors": result.stderr.decode("utf-8", "replace")
         }
+        return results
 
     except FileNotFoundError:
         return {
@@ -130,6 +419,50 @@ def run_mypy_check(
         }
 
 
+@tool
+def run_ruff_check(
+    repo_path: str,
+    file_paths: Optional[list[str]] = None
+) -> dict:
+    """
+    Run ruff linter on Python code
+
+    Args:
+        repo_path: Path to repository
+        file_paths: Optional list of specific files to check
+
+    Returns:
+        Lint results dictionary
+
+    Example:
+        >>> run_ruff_check("/path/to/repo")
+        {"passed": True, "issues_found": 0, "output": "..."}
+    """
+    return _ruff_check(repo_path, file_paths)
+
+
+@tool
+def run_mypy_check(
+    repo_path: str,
+    file_paths: Optional[list[str]] = None
+) -> dict:
+    """
+    Run mypy type checker on Python code
+
+    Args:
+        repo_path: Path to repository
+        file_paths: Optional list of specific files to check
+
+    Returns:
+        Type check results dictionary
+
+    Example:
+        >>> run_mypy_check("/path/to/repo")
+        {"passed": True, "issues_found": 0, "output": "..."}
+    """
+    return _mypy_check(repo_path, file_paths)
+
+
 @tool
 def run_all_quality_checks(
     repo_path: str,
@@ -149,10 +482,22 @@ def run_all_quality_checks(
         >>> run_all_quality_checks("/path/to/repo")
         {"passed": True, "ruff": {...}, "mypy": {...}}
     """
-    ruff_results = run_ruff_check.invoke({"repo_path": repo_path, "file_paths": changed_files})
-    mypy_results = run_mypy_check.invoke({"repo_path": repo_path, "file_paths": changed_files})
+    # Retries with nothing changed (same HEAD, same dirty state, same
+    # file mtimes) return the memoized result without running the tools
+    fingerprint = _checks_fingerprint(repo_path, changed_files)
+    if fingerprint is not None:
+        cached = _ALL_CHECKS_CACHE.get(fingerprint)
+        if cached is not None:
+            return cached
+
+    # Both checks are independent subprocess waits — overlap them so wall
+    # time is max(ruff, mypy) instead of their sum (mypy dominates)
+    ruff_future = _CHECK_EXECUTOR.submit(_ruff_check, repo_path, changed_files)
+    mypy_future = _CHECK_EXECUTOR.submit(_mypy_check, repo_path, changed_files)
+    ruff_results = ruff_future.result()
+    mypy_results = mypy_future.result()
 
-    return {
+    results = {
         "passed": ruff_results["passed"] and mypy_results["passed"],
         "ruff": ruff_results,
         "mypy": mypy_results,
@@ -163,6 +508,13 @@ def run_all_quality_checks(
         }
     }
 
+    if fingerprint is not None:
+        if len(_ALL_CHECKS_CACHE) >= _ALL_CHECKS_CACHE_MAX:
+            _ALL_CHECKS_CACHE.pop(next(iter(_ALL_CHECKS_CACHE)))
+        _ALL_CHECKS_CACHE[fingerprint] = results
+
+    return results
+
 
 __all__ = [
     "run_ruff_check",
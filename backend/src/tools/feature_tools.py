@@ -13,8 +13,431 @@ from langchain_core.tools import tool
 from langchain.tools import InjectedState
 from typing import Optional
 from typing_extensions import Annotated
+from collections import Counter
 import json
 import os
+import re
+
+
+# feature_list.json cache: path -> (st_mtime_ns, features, id_index).
+# The feature tools are called constantly in the agent loop; when the
+# file hasn't changed, one stat replaces the open + parse, and the id
+# index turns per-feature lookups into O(1).
+_FEATURE_CACHE: dict[str, tuple] = {}
+
+
+def _load_features(path: str) -> Optional[list]:
+    """Load feature_list.json with mtime invalidation (None if missing)"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _FEATURE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    index = {f.get("id"): i for i, f in enumerate(data)}
+    _FEATURE_CACHE[path] = (mtime, data, index)
+    return data
+
+
+def _feature_index(path: str) -> dict:
+    """id -> position index for the cached feature list at path"""
+    cached = _FEATURE_CACHE.get(path)
+    return cached[2] if cached is not None else {}
+
+
+def _write_features(path: str, features: list) -> None:
+    """
+    Write feature_list.json atomically and refresh the cache
+
+    Serializes to a sibling temp file and renames it over the target so
+    a crash mid-write can't leave a torn feature list behind.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(features, f, indent=2)
+    os.replace(tmp, path)
+    index = {f.get("id"): i for i, f in enumerate(features)}
+    _FEATURE_CACHE[path] = (os.stat(path).st_mtime_ns, features, index)
+
+
+def _store_features(path: str, features: list) -> None:
+    """
+    Apply a feature-list update: write through to disk and the cache
+
+    Writes are synchronous — the routers and orchestrator read
+    feature_list.json straight from disk, so a status change must be
+    durable before the tool that made it returns.
+    """
+    _write_features(path, features)
+
+
+# Every keyword the generator gates on, matched in a single pass over the
+# description (longest-first so e.g. "addition" wins over "add") instead
+# of one full substring scan per keyword
+_GATING_KEYWORDS = (
+    "simple", "basic", "mvp", "minimal", "full", "complete",
+    "calculator", "swagger", "documentation", "endpoint",
+    "/add", "add", "addition",
+    "/subtract", "subtract", "subtraction",
+    "/multiply", "multiply", "multiplication",
+    "/divide", "divide", "division",
+)
+
+_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, sorted(_GATING_KEYWORDS, key=len, reverse=True)))
+)
+
+
+# Interned tech-stack dicts, one per project-type variant. Every feature
+# in a generated list points at the same object (treated as read-only by
+# all callers; JSON serialization expands it per feature on disk anyway).
+_TECH_STACK_REST_API = {
+    "backend": ["python", "fastapi"],
+    "frontend": None,
+    "database": ["postgresql"],
+    "testing": ["pytest", "httpx"],
+    "deployment": ["docker"]
+}
+
+_TECH_STACK_REST_API_SIMPLE = {
+    "backend": ["python", "fastapi"],
+    "frontend": None,
+    "database": None,
+    "testing": ["pytest", "httpx"],
+    "deployment": ["docker"]
+}
+
+_TECH_STACK_WEB_APP = {
+    "backend": ["python", "fastapi"],
+    "frontend": ["react", "typescript"],
+    "database": ["postgresql"],
+    "testing": ["pytest", "playwright"],
+    "deployment": ["docker"]
+}
+
+_TECH_STACK_CLI_TOOL = {
+    "backend": ["python", "click"],
+    "frontend": None,
+    "database": None,
+    "testing": ["pytest"],
+    "deployment": None
+}
+
+_TECH_STACK_DEFAULT = {
+    "backend": ["python"],
+    "frontend": None,
+    "database": None,
+    "testing": ["pytest"],
+    "deployment": ["docker"]
+}
+
+
+# ---------------------------------------------------------------------------
+# Feature specification tables
+#
+# Each spec is (title, description, acceptance_criteria, priority, complexity)
+# as immutable data. generate_feature_list_from_description selects the
+# applicable specs and materializes all feature dicts in one pass, instead
+# of allocating them through repeated helper calls.
+# ---------------------------------------------------------------------------
+
+_SETUP_PROJECT_STRUCTURE = (
+    "Project structure initialization",
+    "Create basic project directory structure with all necessary folders",
+    (
+        "Project directory created",
+        "Source code folder created",
+        "Tests folder created"
+    ),
+    1, "low"
+)
+
+_SETUP_DEPENDENCIES = (
+    "Dependencies configuration",
+    "Create requirements.txt with all necessary Python dependencies",
+    (
+        "requirements.txt file created",
+        "All core dependencies listed",
+        "Version pinning configured"
+    ),
+    1, "low"
+)
+
+_SETUP_GIT = (
+    "Git configuration",
+    "Initialize git repository and create .gitignore",
+    (
+        "Git repository initialized",
+        ".gitignore file created",
+        "Python-specific ignores configured"
+    ),
+    3, "low"
+)
+
+_CALC_MODELS = (
+    "Pydantic models for calculator",
+    "Create request and response models for calculator operations",
+    (
+        "CalculatorRequest model created with a, b fields",
+        "CalculatorResponse model created with result, operation fields",
+        "Type hints and validation configured"
+    ),
+    1, "low"
+)
+
+# Calculator endpoints: op name -> (trigger keywords, spec)
+_CALC_OPERATIONS = (
+    (
+        ("/add", "add", "addition"),
+        (
+            "POST /calculate/add endpoint",
+            "Implement addition endpoint with proper validation",
+            (
+                "Endpoint accepts POST requests",
+                "Adds two numbers correctly",
+                "Returns proper JSON response",
+                "Validates input using Pydantic"
+            ),
+            1, "low"
+        )
+    ),
+    (
+        ("/subtract", "subtract", "subtraction"),
+        (
+            "POST /calculate/subtract endpoint",
+            "Implement subtraction endpoint with proper validation",
+            (
+                "Endpoint accepts POST requests",
+                "Subtracts two numbers correctly",
+                "Returns proper JSON response",
+                "Validates input using Pydantic"
+            ),
+            1, "low"
+        )
+    ),
+    (
+        ("/multiply", "multiply", "multiplication"),
+        (
+            "POST /calculate/multiply endpoint",
+            "Implement multiplication endpoint with proper validation",
+            (
+                "Endpoint accepts POST requests",
+                "Multiplies two numbers correctly",
+                "Returns proper JSON response",
+                "Validates input using Pydantic"
+            ),
+            1, "low"
+        )
+    ),
+    (
+        ("/divide", "divide", "division"),
+        (
+            "POST /calculate/divide endpoint",
+            "Implement division endpoint with proper validation and error handling",
+            (
+                "Endpoint accepts POST requests",
+                "Divides two numbers correctly",
+                "Returns proper JSON response",
+                "Handles division by zero error"
+            ),
+            1, "medium"
+        )
+    ),
+)
+
+_CALC_SWAGGER = (
+    "Swagger documentation",
+    "Ensure Swagger UI is accessible and all endpoints are documented",
+    (
+        "Swagger UI accessible at /docs",
+        "All endpoints documented with examples",
+        "Request/response schemas properly defined"
+    ),
+    2, "low"
+)
+
+_CALC_TESTS = (
+    "Unit tests for calculator endpoints",
+    "Write comprehensive tests for all calculator operations",
+    (
+        "Test file created in tests/ directory",
+        "Tests for all calculator endpoints",
+        "Tests for edge cases (negative numbers, zero, decimals)",
+        "All tests pass successfully"
+    ),
+    2, "medium"
+)
+
+_REST_BASE = (
+    (
+        "FastAPI application initialization",
+        "Create main FastAPI application with basic configuration",
+        (
+            "FastAPI app instance created",
+            "Main application file created",
+            "CORS middleware configured"
+        ),
+        1, "low"
+    ),
+    (
+        "Health check endpoint",
+        "Implement GET /health endpoint for monitoring",
+        (
+            "Endpoint returns 200 status",
+            "Response includes timestamp",
+            "Endpoint documented in OpenAPI"
+        ),
+        1, "low"
+    ),
+)
+
+_REST_CUSTOM_GET = (
+    "Custom GET endpoint implementation",
+    "Implement the main GET endpoint as per requirements",
+    (
+        "Endpoint created and functional",
+        "Returns expected response",
+        "Proper HTTP status codes"
+    ),
+    1, "medium"
+)
+
+_REST_EXTRAS = (
+    (
+        "Environment variables setup",
+        "Configure environment variables and .env file",
+        (
+            ".env.example file created",
+            "Environment variables loaded",
+            "Configuration validated"
+        ),
+        2, "low"
+    ),
+    (
+        "Logging configuration",
+        "Set up structured logging for the application",
+        (
+            "Logger configured",
+            "Log levels defined",
+            "Request/response logging works"
+        ),
+        2, "low"
+    ),
+    (
+        "Error handling middleware",
+        "Implement global error handling middleware",
+        (
+            "Custom exception handlers created",
+            "Proper error responses returned",
+            "500 errors logged"
+        ),
+        2, "medium"
+    ),
+    (
+        "API documentation (OpenAPI/Swagger)",
+        "Ensure Swagger UI is accessible and documented",
+        (
+            "Swagger UI accessible at /docs",
+            "All endpoints documented",
+            "Request/response schemas defined"
+        ),
+        2, "low"
+    ),
+    (
+        "Request validation",
+        "Implement Pydantic models for request validation",
+        (
+            "Pydantic models created",
+            "Validation errors handled properly",
+            "Type hints used"
+        ),
+        2, "medium"
+    ),
+    (
+        "Unit tests for endpoints",
+        "Write unit tests for all API endpoints",
+        (
+            "Test file created",
+            "All endpoints have tests",
+            "Tests pass successfully"
+        ),
+        2, "medium"
+    ),
+    (
+        "Pytest configuration",
+        "Configure pytest with coverage and fixtures",
+        (
+            "pytest.ini created",
+            "Test fixtures defined",
+            "Coverage threshold set"
+        ),
+        2, "low"
+    ),
+)
+
+_REST_SHIPPING = (
+    (
+        "Docker configuration",
+        "Create Dockerfile and docker-compose.yml",
+        (
+            "Dockerfile created",
+            "docker-compose.yml created",
+            "Application runs in container"
+        ),
+        3, "medium"
+    ),
+    (
+        "README documentation",
+        "Write comprehensive README with setup instructions",
+        (
+            "README.md created",
+            "Setup instructions included",
+            "API endpoints documented"
+        ),
+        3, "low"
+    ),
+)
+
+_WEB_APP_FEATURES = (
+    (
+        "Frontend project setup",
+        "Initialize React/TypeScript frontend project",
+        (
+            "Frontend directory created",
+            "React app initialized",
+            "TypeScript configured"
+        ),
+        1, "medium"
+    ),
+    (
+        "Backend API initialization",
+        "Set up FastAPI backend with database",
+        (
+            "FastAPI app created",
+            "Database connection configured",
+            "API routes defined"
+        ),
+        1, "medium"
+    ),
+)
+
+_CLI_FEATURES = (
+    (
+        "CLI framework setup",
+        "Initialize Click-based CLI application",
+        (
+            "Click installed",
+            "Main CLI group created",
+            "Entry point configured"
+        ),
+        1, "low"
+    ),
+)
 
 
 @tool
@@ -39,416 +462,114 @@ def generate_feature_list_from_description(
     Returns:
         List of feature dictionaries in standard format
     """
-    features = []
     description_lower = project_description.lower()
-    
+
+    # One scan over the description finds every gating keyword; the checks
+    # below are then O(1) set probes
+    hits = set(_KEYWORD_RE.findall(description_lower))
+
     # CRITICAL: Detect project complexity from description
     complexity = "medium"  # default
     max_features = estimated_count
-    
-    if "simple" in description_lower or "basic" in description_lower:
+
+    if "simple" in hits or "basic" in hits:
         complexity = "simple"
         max_features = min(6, estimated_count)
-    elif "mvp" in description_lower or "minimal" in description_lower:
+    elif "mvp" in hits or "minimal" in hits:
         complexity = "mvp"
         max_features = min(12, estimated_count)
-    elif "full" in description_lower or "complete" in description_lower:
+    elif "full" in hits or "complete" in hits:
         complexity = "full"
         max_features = max(20, estimated_count)
 
-    # Determine tech stack based on project type
+    # Determine tech stack based on project type (interned — every
+    # generated feature shares the same dict by reference)
     if project_type == "rest_api":
-        backend = ["python", "fastapi"]
-        frontend = None
-        database = None if "simple" in project_description.lower() else ["postgresql"]
-        testing = ["pytest", "httpx"]
-        deployment = ["docker"]
+        tech_stack = (
+            _TECH_STACK_REST_API_SIMPLE if "simple" in hits
+            else _TECH_STACK_REST_API
+        )
     elif project_type == "web_app":
-        backend = ["python", "fastapi"]
-        frontend = ["react", "typescript"]
-        database = ["postgresql"]
-        testing = ["pytest", "playwright"]
-        deployment = ["docker"]
+        tech_stack = _TECH_STACK_WEB_APP
     elif project_type == "cli_tool":
-        backend = ["python", "click"]
-        frontend = None
-        database = None
-        testing = ["pytest"]
-        deployment = None
+        tech_stack = _TECH_STACK_CLI_TOOL
     else:
-        # Default
-        backend = ["python"]
-        frontend = None
-        database = None
-        testing = ["pytest"]
-        deployment = ["docker"]
-
-    # Feature ID counter
-    feature_count = 1
-
-    def add_feature(title: str, description: str, criteria: list, priority: int, complexity: str):
-        nonlocal feature_count
-        features.append({
-            "id": f"f-{feature_count:03d}",
-            "title": title,
-            "description": description,
-            "acceptance_criteria": criteria,
-            "status": "pending",
-            "priority": priority,
-            "complexity": complexity,
-            "attempts": 0,
-            "tech_stack": {
-                "backend": backend,
-                "frontend": frontend,
-                "database": database,
-                "testing": testing,
-                "deployment": deployment
-            }
-        })
-        feature_count += 1
+        tech_stack = _TECH_STACK_DEFAULT
+
+    # Select the applicable specs from the module-level tables; the dicts
+    # are materialized in one pass at the end
+    selected: list[tuple] = []
 
     # === CORE SETUP FEATURES (Priority 1) ===
-    # Only add setup features if not too simple
-    if complexity != "simple" or feature_count == 1:
-        add_feature(
-            "Project structure initialization",
-            "Create basic project directory structure with all necessary folders",
-            [
-                "Project directory created",
-                "Source code folder created",
-                "Tests folder created"
-            ],
-            priority=1,
-            complexity="low"
-        )
+    selected.append(_SETUP_PROJECT_STRUCTURE)
+    selected.append(_SETUP_DEPENDENCIES)
 
-    add_feature(
-        "Dependencies configuration",
-        "Create requirements.txt with all necessary Python dependencies",
-        [
-            "requirements.txt file created",
-            "All core dependencies listed",
-            "Version pinning configured"
-        ],
-        priority=1,
-        complexity="low"
-    )
-    
     # Only add Git config for non-simple projects (Git is already initialized by Initializer)
     if complexity != "simple":
-        add_feature(
-            "Git configuration",
-            "Initialize git repository and create .gitignore",
-            [
-                "Git repository initialized",
-                ".gitignore file created",
-                "Python-specific ignores configured"
-            ],
-            priority=3,
-            complexity="low"
-        )
+        selected.append(_SETUP_GIT)
 
     # === REST API SPECIFIC FEATURES ===
     if project_type == "rest_api":
-        
+
         # SPECIAL CASE: Calculator project - parse specific endpoints
-        if "calculator" in description_lower:
-            # Add Pydantic models feature
-            add_feature(
-                "Pydantic models for calculator",
-                "Create request and response models for calculator operations",
-                [
-                    "CalculatorRequest model created with a, b fields",
-                    "CalculatorResponse model created with result, operation fields",
-                    "Type hints and validation configured"
-                ],
-                priority=1,
-                complexity="low"
-            )
-            
+        if "calculator" in hits:
+            selected.append(_CALC_MODELS)
+
             # Parse specific operations mentioned
-            if "/add" in description_lower or "add" in description_lower or "addition" in description_lower:
-                add_feature(
-                    "POST /calculate/add endpoint",
-                    "Implement addition endpoint with proper validation",
-                    [
-                        "Endpoint accepts POST requests",
-                        "Adds two numbers correctly",
-                        "Returns proper JSON response",
-                        "Validates input using Pydantic"
-                    ],
-                    priority=1,
-                    complexity="low"
-                )
-            
-            if "/subtract" in description_lower or "subtract" in description_lower or "subtraction" in description_lower:
-                add_feature(
-                    "POST /calculate/subtract endpoint",
-                    "Implement subtraction endpoint with proper validation",
-                    [
-                        "Endpoint accepts POST requests",
-                        "Subtracts two numbers correctly",
-                        "Returns proper JSON response",
-                        "Validates input using Pydantic"
-                    ],
-                    priority=1,
-                    complexity="low"
-                )
-            
-            if "/multiply" in description_lower or "multiply" in description_lower or "multiplication" in description_lower:
-                add_feature(
-                    "POST /calculate/multiply endpoint",
-                    "Implement multiplication endpoint with proper validation",
-                    [
-                        "Endpoint accepts POST requests",
-                        "Multiplies two numbers correctly",
-                        "Returns proper JSON response",
-                        "Validates input using Pydantic"
-                    ],
-                    priority=1,
-                    complexity="low"
-                )
-            
-            if "/divide" in description_lower or "divide" in description_lower or "division" in description_lower:
-                add_feature(
-                    "POST /calculate/divide endpoint",
-                    "Implement division endpoint with proper validation and error handling",
-                    [
-                        "Endpoint accepts POST requests",
-                        "Divides two numbers correctly",
-                        "Returns proper JSON response",
-                        "Handles division by zero error"
-                    ],
-                    priority=1,
-                    complexity="medium"
-                )
-            
+            for keywords, spec in _CALC_OPERATIONS:
+                if not hits.isdisjoint(keywords):
+                    selected.append(spec)
+
             # Add Swagger documentation
-            if "swagger" in description_lower or "documentation" in description_lower or complexity != "simple":
-                add_feature(
-                    "Swagger documentation",
-                    "Ensure Swagger UI is accessible and all endpoints are documented",
-                    [
-                        "Swagger UI accessible at /docs",
-                        "All endpoints documented with examples",
-                        "Request/response schemas properly defined"
-                    ],
-                    priority=2,
-                    complexity="low"
-                )
-            
+            if "swagger" in hits or "documentation" in hits or complexity != "simple":
+                selected.append(_CALC_SWAGGER)
+
             # Add tests for simple projects
             if complexity == "simple":
-                add_feature(
-                    "Unit tests for calculator endpoints",
-                    "Write comprehensive tests for all calculator operations",
-                    [
-                        "Test file created in tests/ directory",
-                        "Tests for all calculator endpoints",
-                        "Tests for edge cases (negative numbers, zero, decimals)",
-                        "All tests pass successfully"
-                    ],
-                    priority=2,
-                    complexity="medium"
-                )
-        
+                selected.append(_CALC_TESTS)
+
         # GENERAL REST API (not calculator)
         else:
-            add_feature(
-                "FastAPI application initialization",
-                "Create main FastAPI application with basic configuration",
-                [
-                    "FastAPI app instance created",
-                    "Main application file created",
-                    "CORS middleware configured"
-                ],
-                priority=1,
-                complexity="low"
-            )
-
-            add_feature(
-                "Health check endpoint",
-                "Implement GET /health endpoint for monitoring",
-                [
-                    "Endpoint returns 200 status",
-                    "Response includes timestamp",
-                    "Endpoint documented in OpenAPI"
-                ],
-                priority=1,
-                complexity="low"
-            )
+            selected.extend(_REST_BASE)
 
             # Check if user wants custom endpoint (parse description)
-            if "endpoint" in description_lower or "GET" in description_lower:
-                add_feature(
-                    "Custom GET endpoint implementation",
-                    "Implement the main GET endpoint as per requirements",
-                    [
-                        "Endpoint created and functional",
-                        "Returns expected response",
-                        "Proper HTTP status codes"
-                    ],
-                    priority=1,
-                    complexity="medium"
-                )
+            if "endpoint" in hits or "GET" in description_lower:
+                selected.append(_REST_CUSTOM_GET)
 
             # Only add these for non-simple, non-calculator projects
-            if complexity != "simple" and "calculator" not in description_lower:
-                add_feature(
-                    "Environment variables setup",
-                    "Configure environment variables and .env file",
-                    [
-                        ".env.example file created",
-                        "Environment variables loaded",
-                        "Configuration validated"
-                    ],
-                    priority=2,
-                    complexity="low"
-                )
-
-                add_feature(
-                    "Logging configuration",
-                    "Set up structured logging for the application",
-                    [
-                        "Logger configured",
-                        "Log levels defined",
-                        "Request/response logging works"
-                    ],
-                    priority=2,
-                    complexity="low"
-                )
-
-                add_feature(
-                    "Error handling middleware",
-                    "Implement global error handling middleware",
-                    [
-                        "Custom exception handlers created",
-                        "Proper error responses returned",
-                        "500 errors logged"
-                    ],
-                    priority=2,
-                    complexity="medium"
-                )
-
-                add_feature(
-                    "API documentation (OpenAPI/Swagger)",
-                    "Ensure Swagger UI is accessible and documented",
-                    [
-                        "Swagger UI accessible at /docs",
-                        "All endpoints documented",
-                        "Request/response schemas defined"
-                    ],
-                    priority=2,
-                    complexity="low"
-                )
-
-                add_feature(
-                    "Request validation",
-                    "Implement Pydantic models for request validation",
-                    [
-                        "Pydantic models created",
-                        "Validation errors handled properly",
-                        "Type hints used"
-                    ],
-                    priority=2,
-                    complexity="medium"
-                )
-
-                add_feature(
-                    "Unit tests for endpoints",
-                    "Write unit tests for all API endpoints",
-                    [
-                        "Test file created",
-                        "All endpoints have tests",
-                        "Tests pass successfully"
-                    ],
-                    priority=2,
-                    complexity="medium"
-                )
-
-                add_feature(
-                    "Pytest configuration",
-                    "Configure pytest with coverage and fixtures",
-                    [
-                        "pytest.ini created",
-                        "Test fixtures defined",
-                        "Coverage threshold set"
-                    ],
-                    priority=2,
-                    complexity="low"
-                )
+            if complexity != "simple" and "calculator" not in hits:
+                selected.extend(_REST_EXTRAS)
 
             # Only add Docker/README for MVP or full projects
             if complexity in ["mvp", "full"]:
-                add_feature(
-                    "Docker configuration",
-                    "Create Dockerfile and docker-compose.yml",
-                    [
-                        "Dockerfile created",
-                        "docker-compose.yml created",
-                        "Application runs in container"
-                    ],
-                    priority=3,
-                    complexity="medium"
-                )
-
-                add_feature(
-                    "README documentation",
-                    "Write comprehensive README with setup instructions",
-                    [
-                        "README.md created",
-                        "Setup instructions included",
-                        "API endpoints documented"
-                    ],
-                    priority=3,
-                    complexity="low"
-                )
+                selected.extend(_REST_SHIPPING)
 
     # === WEB APP SPECIFIC FEATURES ===
     elif project_type == "web_app" and complexity != "simple":
-        add_feature(
-            "Frontend project setup",
-            "Initialize React/TypeScript frontend project",
-            [
-                "Frontend directory created",
-                "React app initialized",
-                "TypeScript configured"
-            ],
-            priority=1,
-            complexity="medium"
-        )
-
-        add_feature(
-            "Backend API initialization",
-            "Set up FastAPI backend with database",
-            [
-                "FastAPI app created",
-                "Database connection configured",
-                "API routes defined"
-            ],
-            priority=1,
-            complexity="medium"
-        )
+        selected.extend(_WEB_APP_FEATURES)
 
     # === CLI TOOL SPECIFIC FEATURES ===
     elif project_type == "cli_tool":
-        add_feature(
-            "CLI framework setup",
-            "Initialize Click-based CLI application",
-            [
-                "Click installed",
-                "Main CLI group created",
-                "Entry point configured"
-            ],
-            priority=1,
-            complexity="low"
-        )
+        selected.extend(_CLI_FEATURES)
 
     # Limit features to max_features
-    if len(features) > max_features:
-        features = features[:max_features]
-    
-    return features
+    del selected[max_features:]
+
+    return [
+        {
+            "id": f"f-{i:03d}",
+            "title": title,
+            "description": description,
+            "acceptance_criteria": list(criteria),
+            "status": "pending",
+            "priority": priority,
+            "complexity": feature_complexity,
+            "attempts": 0,
+            "tech_stack": tech_stack
+        }
+        for i, (title, description, criteria, priority, feature_complexity)
+        in enumerate(selected, 1)
+    ]
 
 
 @tool
@@ -477,43 +598,47 @@ def select_next_feature(state: Annotated[dict, InjectedState]) -> Optional[dict]
     repo_path = state.get("repo_path", "")
     feature_list_path = os.path.join(repo_path, "feature_list.json")
 
-    if not os.path.exists(feature_list_path):
+    feature_list = _load_features(feature_list_path)
+    if feature_list is None:
         return None
 
-    with open(feature_list_path, "r", encoding="utf-8") as f:
-        feature_list = json.load(f)
-
-    # Helper to safely get priority as int
+    # Helper to safely get priority as int. Runs once per feature per
+    # min() key call, so the common int case short-circuits without the
+    # str() allocation + isdigit scan of the old check.
     def get_priority(f):
         p = f.get("priority", 999)
-        return int(p) if isinstance(p, (int, str)) and str(p).isdigit() else 999
+        if isinstance(p, int):
+            return p
+        if isinstance(p, str):
+            try:
+                return int(p)
+            except ValueError:
+                return 999
+        return 999
 
     # PRIORITY 1: Features that need retry (status = "testing" means tests failed)
-    # These should be fixed before starting new features
-    testing_features = [
-        f for f in feature_list
-        if f.get("status") == "testing"
-    ]
-    
-    if testing_features:
-        # Sort by priority, then by attempts (fewer attempts first)
-        testing_features.sort(key=lambda f: (get_priority(f), f.get("attempts", 0)))
-        selected = testing_features[0]
+    # These should be fixed before starting new features.
+    # Only the single best candidate matters, so a min() pass replaces the
+    # filter-then-sort (O(N) instead of O(N log N), no intermediate lists).
+    # Best by priority, then by attempts (fewer attempts first)
+    selected = min(
+        (f for f in feature_list if f.get("status") == "testing"),
+        key=lambda f: (get_priority(f), f.get("attempts", 0)),
+        default=None
+    )
+    if selected is not None:
         print(f"\n[select_next_feature] Retry feature: {selected['id']} (attempts: {selected.get('attempts', 0)})")
         return selected
 
-    # PRIORITY 2: New pending features
-    pending_features = [
-        f for f in feature_list
-        if f.get("status") == "pending"
-    ]
-
-    if not pending_features:
+    # PRIORITY 2: New pending features (best priority; 1 is highest)
+    selected = min(
+        (f for f in feature_list if f.get("status") == "pending"),
+        key=get_priority,
+        default=None
+    )
+    if selected is None:
         return None
 
-    # Sort by priority (1 is highest)
-    pending_features.sort(key=lambda f: get_priority(f))
-    selected = pending_features[0]
     print(f"\n[select_next_feature] New feature: {selected['id']}")
     return selected
 
@@ -557,41 +682,35 @@ def update_feature_status(
     repo_path = state.get("repo_path", "")
     feature_list_path = os.path.join(repo_path, "feature_list.json")
 
-    if not os.path.exists(feature_list_path):
-        return f"Error: feature_list.json not found at {feature_list_path}"
-
     try:
-        with open(feature_list_path, "r", encoding="utf-8") as f:
-            features = json.load(f)
+        features = _load_features(feature_list_path)
+        if features is None:
+            return f"Error: feature_list.json not found at {feature_list_path}"
 
-        # Find and update feature
-        updated = False
-        attempts = 0
-        for feature in features:
-            if feature["id"] == feature_id:
-                old_status = feature.get("status", "unknown")
-                feature["status"] = new_status
-                
-                # Handle attempts counter
-                if increment_attempts:
-                    feature["attempts"] = feature.get("attempts", 0) + 1
-                    attempts = feature["attempts"]
-                    print(f"[update_feature_status] {feature_id}: attempts incremented to {attempts}")
-                
-                # Reset attempts when feature is done
-                if new_status == "done":
-                    feature["attempts"] = 0
-                
-                updated = True
-                print(f"[update_feature_status] {feature_id}: {old_status} -> {new_status}")
-                break
-
-        if not updated:
+        # Find and update feature (O(1) via the cached id index)
+        i = _feature_index(feature_list_path).get(feature_id)
+        if i is None:
             return f"Error: Feature '{feature_id}' not found"
 
+        feature = features[i]
+        old_status = feature.get("status", "unknown")
+        feature["status"] = new_status
+
+        # Handle attempts counter
+        attempts = 0
+        if increment_attempts:
+            feature["attempts"] = feature.get("attempts", 0) + 1
+            attempts = feature["attempts"]
+            print(f"[update_feature_status] {feature_id}: attempts incremented to {attempts}")
+
+        # Reset attempts when feature is done
+        if new_status == "done":
+            feature["attempts"] = 0
+
+        print(f"[update_feature_status] {feature_id}: {old_status} -> {new_status}")
+
         # Write back
-        with open(feature_list_path, "w", encoding="utf-8") as f:
-            json.dump(features, f, indent=2)
+        _store_features(feature_list_path, features)
 
         msg = f"Feature '{feature_id}' status updated to '{new_status}'"
         if increment_attempts:
@@ -621,26 +740,24 @@ def increment_feature_attempts(
     repo_path = state.get("repo_path", "")
     feature_list_path = os.path.join(repo_path, "feature_list.json")
 
-    if not os.path.exists(feature_list_path):
-        return f"Error: feature_list.json not found at {feature_list_path}"
-
     try:
-        with open(feature_list_path, "r", encoding="utf-8") as f:
-            features = json.load(f)
-
-        for feature in features:
-            if feature["id"] == feature_id:
-                feature["attempts"] = feature.get("attempts", 0) + 1
-                attempts = feature["attempts"]
-                
-                # Write back
-                with open(feature_list_path, "w", encoding="utf-8") as f:
-                    json.dump(features, f, indent=2)
-                
-                print(f"[increment_feature_attempts] {feature_id}: attempts = {attempts}")
-                return f"Feature '{feature_id}' attempts incremented to {attempts}"
-
-        return f"Error: Feature '{feature_id}' not found"
+        features = _load_features(feature_list_path)
+        if features is None:
+            return f"Error: feature_list.json not found at {feature_list_path}"
+
+        i = _feature_index(feature_list_path).get(feature_id)
+        if i is None:
+            return f"Error: Feature '{feature_id}' not found"
+
+        feature = features[i]
+        feature["attempts"] = feature.get("attempts", 0) + 1
+        attempts = feature["attempts"]
+
+        # Write back
+        _store_features(feature_list_path, features)
+
+        print(f"[increment_feature_attempts] {feature_id}: attempts = {attempts}")
+        return f"Feature '{feature_id}' attempts incremented to {attempts}"
 
     except Exception as e:
         return f"Error incrementing attempts: {e}"
@@ -667,16 +784,12 @@ def get_feature_by_id(
     repo_path = state.get("repo_path", "")
     feature_list_path = os.path.join(repo_path, "feature_list.json")
 
-    if not os.path.exists(feature_list_path):
+    feature_list = _load_features(feature_list_path)
+    if feature_list is None:
         return None
 
-    with open(feature_list_path, "r", encoding="utf-8") as f:
-        feature_list = json.load(f)
-
-    for feature in feature_list:
-        if feature.get("id") == feature_id:
-            return feature
-    return None
+    i = _feature_index(feature_list_path).get(feature_id)
+    return feature_list[i] if i is not None else None
 
 
 @tool
@@ -690,19 +803,14 @@ def count_features_by_status(feature_list: list[dict]) -> dict:
     Returns:
         Dictionary with counts per status
     """
+    # Counter does the tallying in C instead of a Python branch per feature
+    c = Counter(f.get("status", "pending") for f in feature_list)
+
     counts = {
-        "pending": 0,
-        "in_progress": 0,
-        "testing": 0,
-        "done": 0,
-        "failed": 0
+        status: c.get(status, 0)
+        for status in ("pending", "in_progress", "testing", "done", "failed")
     }
 
-    for feature in feature_list:
-        status = feature.get("status", "pending")
-        if status in counts:
-            counts[status] += 1
-
     counts["total"] = len(feature_list)
     counts["completion_percentage"] = (
         (counts["done"] / len(feature_list) * 100) if feature_list else 0
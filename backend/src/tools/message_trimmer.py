@@ -1,20 +1,35 @@
 """
 Message Trimmer Tool - Phase 4.1
-Uses LangChain 1.1.0 trim_messages utility to keep conversation history manageable
+Keeps conversation history under a token budget with a single reverse scan
 """
 
-from langchain_core.messages import trim_messages, SystemMessage, HumanMessage
+from langchain_core.messages import SystemMessage, HumanMessage
 from typing import List
 
 
+def _approx_tokens(message) -> int:
+    """
+    Approximate token count of a message (plain string or content blocks).
+
+    Uses the len(text) // 3 heuristic, which tracks BPE tokenizers within a
+    few percent for typical English/code content at negligible cost.
+    """
+    content = message.content
+    if isinstance(content, str):
+        chars = len(content)
+    else:
+        chars = sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+    return chars // 3
+
+
 def trim_conversation_history(messages: List, max_tokens: int = 4000) -> List:
     """
-    Trim conversation history using LangChain 1.1.0 built-in utility.
+    Trim conversation history to the most recent messages under budget.
 
     Strategy:
-    - Keep most recent messages (strategy="last")
-    - Always preserve SystemMessages (include_system=True)
-    - Ensure conversation starts with HumanMessage (start_on="human")
+    - Keep most recent messages (single reverse scan, stop when over budget)
+    - Always preserve SystemMessages
+    - Ensure conversation starts with HumanMessage
     - Preserve original project prompt
 
     Args:
@@ -27,24 +42,33 @@ def trim_conversation_history(messages: List, max_tokens: int = 4000) -> List:
     if not messages:
         return []
 
-    # Use LangChain's built-in trim_messages utility
-    trimmed = trim_messages(
-        messages,
-        max_tokens=max_tokens,
-        strategy="last",  # Keep most recent messages
-        token_counter=len,  # Fast approximation (character count)
-        include_system=True,  # Always keep SystemMessages
-        start_on="human",  # Ensure starts with HumanMessage
-        allow_partial=False  # Don't partially trim messages
-    )
+    # System messages are always kept and don't compete for the budget
+    system_msgs = [m for m in messages if isinstance(m, SystemMessage)]
+
+    # Walk from the end, accumulating until the budget is exceeded.
+    # Always keep at least the most recent message.
+    total = 0
+    kept_tail: List = []
+    for message in reversed(messages):
+        if isinstance(message, SystemMessage):
+            continue
+        size = _approx_tokens(message)
+        if kept_tail and total + size > max_tokens:
+            break
+        total += size
+        kept_tail.append(message)
+    kept_tail.reverse()
+
+    # Drop leading AI/tool messages so the window starts on a human turn
+    start = 0
+    while start < len(kept_tail) and not isinstance(kept_tail[start], HumanMessage):
+        start += 1
+    kept_tail = kept_tail[start:]
 
     # Ensure original project prompt (first HumanMessage) is preserved
     # This contains the project description and is critical context
     original_human = next((m for m in messages if isinstance(m, HumanMessage)), None)
-    if original_human and original_human not in trimmed:
-        # Re-insert original prompt after system messages
-        system_msgs = [m for m in trimmed if isinstance(m, SystemMessage)]
-        other_msgs = [m for m in trimmed if not isinstance(m, SystemMessage)]
-        trimmed = system_msgs + [original_human] + other_msgs
+    if original_human is not None and original_human not in kept_tail:
+        return system_msgs + [original_human] + kept_tail
 
-    return trimmed
+    return system_msgs + kept_tail
@@ -11,66 +11,105 @@ This ensures:
 """
 
 import os
-import json
+import re
 from typing import List, Dict, Any
 from datetime import datetime
 import subprocess
 
+from src.utils import fastjson
+from src.utils.logging import logger
+
 
 def get_pending_ops_path(repo_path: str) -> str:
     """Get path to pending_ops.json file"""
     return os.path.join(repo_path, "pending_ops.json")
 
 
-def load_pending_ops(repo_path: str) -> Dict[str, List[Dict[str, Any]]]:
+# pending_ops cache: path -> (st_mtime_ns, ops). Reads during a feature
+# run are frequent; an unchanged file costs one stat instead of a parse.
+# Writes stay synchronous — this is a crash-recovery journal, so
+# mark_pending must reach disk before the operation it guards runs.
+_PENDING_CACHE: dict = {}
+
+
+def load_pending_ops(repo_path: str) -> Dict[str, Any]:
     """
     Load pending operations from disk
     
     Returns:
-        Dict with pending operations by type:
+        Dict with pending operations by type, keyed by feature ID (v2):
         {
-            "commits": [{"feature_id": "f-001", "timestamp": "..."}],
-            "pushes": [{"feature_id": "f-001", "timestamp": "..."}],
-            "docs": [{"feature_id": "f-001", "timestamp": "..."}]
+            "version": 2,
+            "commits": {"f-001": "<timestamp>"},
+            "pushes": {"f-001": "<timestamp>"},
+            "docs": {"f-001": "<timestamp>"}
         }
+
+        v1 files (lists of {"feature_id", "timestamp"} dicts) are
+        migrated to this shape transparently on read.
     """
     path = get_pending_ops_path(repo_path)
-    
+
     default = {
-        "commits": [],
-        "pushes": [],
-        "docs": []
+        "version": 2,
+        "commits": {},
+        "pushes": {},
+        "docs": {}
     }
-    
-    if not os.path.exists(path):
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
         return default
-    
+
+    cached = _PENDING_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            # Ensure all keys exist
-            for key in default:
-                if key not in data:
-                    data[key] = []
-            return data
+        data = fastjson.load_path(path)
+        # Ensure all keys exist, migrating v1 list buckets
+        # ([{"feature_id": ..., "timestamp": ...}]) to v2 dicts on read
+        for key in ("commits", "pushes", "docs"):
+            bucket = data.get(key)
+            if isinstance(bucket, list):
+                data[key] = {
+                    o["feature_id"]: o.get("timestamp")
+                    for o in bucket if "feature_id" in o
+                }
+            elif bucket is None:
+                data[key] = {}
+        data["version"] = 2
+        _PENDING_CACHE[path] = (mtime, data)
+        return data
     except Exception as e:
-        print(f"[WARN]  Failed to load pending_ops.json: {e}")
+        logger.warning("Failed to load pending_ops.json: %s", e)
         return default
 
 
-def save_pending_ops(repo_path: str, ops: Dict[str, List[Dict[str, Any]]]) -> None:
+def save_pending_ops(repo_path: str, ops: Dict[str, Any]) -> None:
     """Save pending operations to disk"""
     path = get_pending_ops_path(repo_path)
     
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(ops, f, indent=2, default=str)
-        
+        # Timestamps are stored as isoformat strings at insert time, so no
+        # default= hook is needed; fastjson serializes straight to bytes.
+        # Compact (no indent) — the journal is machine-consumed and
+        # gitignored, so pretty-printing just inflates every rewrite.
+        # Write to a sibling tempfile and rename so readers never see a
+        # half-written journal; no fsync — the journal is rebuilt from git
+        # truth on recovery, so crash durability of this file isn't needed.
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(fastjson.dumps(ops))
+        os.replace(tmp, path)
+        _PENDING_CACHE[path] = (os.stat(path).st_mtime_ns, ops)
+
         # Ensure pending_ops.json is in .gitignore (we don't want to commit this)
         _ensure_gitignore_entry(repo_path, "pending_ops.json")
         
     except Exception as e:
-        print(f"[WARN]  Failed to save pending_ops.json: {e}")
+        logger.warning("Failed to save pending_ops.json: %s", e)
 
 
 # Mapping from singular to plural for operation types
@@ -90,25 +129,35 @@ def _normalize_op_type(op_type: str) -> str:
     return _OP_TYPE_PLURAL.get(op_type, op_type + "s")
 
 
+# (repo_path, entry) pairs already confirmed in .gitignore — the check
+# runs on every save_pending_ops, but only ever needs to do work once
+_GITIGNORE_ENSURED: set = set()
+
+
 def _ensure_gitignore_entry(repo_path: str, entry: str) -> None:
     """Add an entry to .gitignore if not already present"""
+    key = (repo_path, entry)
+    if key in _GITIGNORE_ENSURED:
+        return
+
     gitignore_path = os.path.join(repo_path, ".gitignore")
-    
+
     try:
         # Read existing content
         existing = ""
         if os.path.exists(gitignore_path):
             with open(gitignore_path, "r", encoding="utf-8") as f:
                 existing = f.read()
-        
-        # Check if entry already exists
-        entries = [line.strip() for line in existing.splitlines()]
-        if entry not in entries:
+
+        # Check if entry already exists (as a whole line)
+        if entry not in (line.strip() for line in existing.splitlines()):
             # Add entry
             with open(gitignore_path, "a", encoding="utf-8") as f:
                 if existing and not existing.endswith("\n"):
                     f.write("\n")
                 f.write(f"{entry}\n")
+
+        _GITIGNORE_ENSURED.add(key)
     except Exception:
         pass  # Silent fail - not critical
 
@@ -127,19 +176,14 @@ def mark_pending(repo_path: str, op_type: str, feature_id: str) -> None:
     """
     ops = load_pending_ops(repo_path)
     op_key = _normalize_op_type(op_type)
-    
-    # Check if already pending
-    existing = [o for o in ops[op_key] if o.get("feature_id") == feature_id]
-    if existing:
+
+    if feature_id in ops[op_key]:
         return  # Already pending
-    
-    ops[op_key].append({
-        "feature_id": feature_id,
-        "timestamp": datetime.now().isoformat()
-    })
-    
+
+    ops[op_key][feature_id] = datetime.now().isoformat()
+
     save_pending_ops(repo_path, ops)
-    print(f"[LOG] Marked pending: {op_type} for {feature_id}")
+    logger.info("Marked pending: %s for %s", op_type, feature_id)
 
 
 def clear_pending(repo_path: str, op_type: str, feature_id: str) -> None:
@@ -155,70 +199,84 @@ def clear_pending(repo_path: str, op_type: str, feature_id: str) -> None:
     """
     ops = load_pending_ops(repo_path)
     op_key = _normalize_op_type(op_type)
-    
-    # Remove this feature from pending
-    ops[op_key] = [o for o in ops[op_key] if o.get("feature_id") != feature_id]
-    
+
+    # Remove this feature from pending; skip the rewrite if it wasn't there
+    if ops[op_key].pop(feature_id, None) is None:
+        return
+
     save_pending_ops(repo_path, ops)
-    print(f"[OK] Cleared pending: {op_type} for {feature_id}")
+    logger.info("Cleared pending: %s for %s", op_type, feature_id)
 
 
 def clear_all_pending(repo_path: str, feature_id: str) -> None:
     """Clear all pending operations for a feature"""
     ops = load_pending_ops(repo_path)
-    
-    for op_key in ["commits", "pushes", "docs"]:
-        ops[op_key] = [o for o in ops[op_key] if o.get("feature_id") != feature_id]
-    
+
+    removed = False
+    for op_key in ("commits", "pushes", "docs"):
+        if ops[op_key].pop(feature_id, None) is not None:
+            removed = True
+
+    if not removed:
+        return
+
     save_pending_ops(repo_path, ops)
-    print(f"[OK] Cleared all pending ops for {feature_id}")
+    logger.info("Cleared all pending ops for %s", feature_id)
+
+
+# git-history scan results keyed by repo path. Valid as long as HEAD is
+# unchanged — a cheap rev-parse replaces the full log walk on repeat calls.
+_COMMITTED_CACHE: dict = {}
+
+# Matches the 'feat(f-XXX)' convention used for feature commits
+_FEATURE_COMMIT_RE = re.compile(r"feat\((f-[\w-]+)\)")
 
 
 def get_committed_features(repo_path: str) -> List[str]:
     """
     Get list of feature IDs that have commits in git history
-    
+
     Searches git log for commits with pattern 'feat(f-XXX)'
-    
+
     Returns:
         List of feature IDs that have been committed
     """
     try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace"
+        ).stdout.strip()
+
+        cached = _COMMITTED_CACHE.get(repo_path)
+        if head and cached is not None and cached[0] == head:
+            return cached[1]
+
+        # Filter inside git (--grep, basic-regex literal) and emit only
+        # subject lines, so non-matching commits never cross the pipe
         result = subprocess.run(
-            ["git", "log", "--oneline", "--all"],
+            ["git", "log", "--all", "--grep=feat(f-", "--format=%s"],
             cwd=repo_path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             encoding="utf-8",
             errors="replace"
         )
-        
+
         if result.returncode != 0:
             return []
-        
-        # Parse commit messages for feature IDs
-        committed = []
-        for line in result.stdout.splitlines():
-            # Look for feat(f-XXX) pattern
-            if "feat(f-" in line:
-                # Extract feature ID: find "feat(" then extract until ")"
-                feat_start = line.find("feat(")
-                if feat_start == -1:
-                    continue
-                    
-                # Start after "feat(" (5 chars)
-                id_start = feat_start + 5
-                # Find closing parenthesis
-                id_end = line.find(")", id_start)
-                
-                if id_end > id_start:
-                    feature_id = line[id_start:id_end]  # e.g., "f-001"
-                    if feature_id.startswith("f-"):  # Validate it's a feature ID
-                        committed.append(feature_id)
-        
-        return list(set(committed))  # Unique IDs
-        
+
+        # Extract unique feature IDs from the pre-filtered subject lines
+        committed = list({m.group(1) for m in _FEATURE_COMMIT_RE.finditer(result.stdout)})
+        if head:
+            _COMMITTED_CACHE[repo_path] = (head, committed)
+        return committed
+
     except Exception as e:
-        print(f"[WARN]  Failed to get git history: {e}")
+        logger.warning("Failed to get git history: %s", e)
         return []
 
 
@@ -240,22 +298,20 @@ def check_recovery_needed(repo_path: str, feature_list: List[Dict[str, Any]]) ->
         }
     """
     # Get features already committed
-    committed_features = get_committed_features(repo_path)
-    
-    # Get features marked as done locally
-    done_features = [f["id"] for f in feature_list if f.get("status") == "done"]
-    
-    # Find features that are done but not committed
-    needs_commit = [fid for fid in done_features if fid not in committed_features]
-    
-    # Also check pending_ops.json for explicit pending ops
+    committed = set(get_committed_features(repo_path))
+
+    # Explicit pending ops from pending_ops.json (v2 buckets are dicts
+    # keyed by feature ID, so the keys are the IDs)
     pending_ops = load_pending_ops(repo_path)
-    pending_commits = [o["feature_id"] for o in pending_ops.get("commits", [])]
-    pending_pushes = [o["feature_id"] for o in pending_ops.get("pushes", [])]
-    
-    # Merge explicit pending with detected missing
-    needs_commit = list(set(needs_commit + pending_commits))
-    needs_push = list(set(pending_pushes))
+    needs_commit_set = set(pending_ops.get("commits", {}))
+
+    # Single pass: features done locally but absent from git history
+    for f in feature_list:
+        if f.get("status") == "done" and f["id"] not in committed:
+            needs_commit_set.add(f["id"])
+
+    needs_commit = list(needs_commit_set)
+    needs_push = list(pending_ops.get("pushes", {}))
     
     result = {
         "needs_commit": needs_commit,
@@ -263,11 +319,10 @@ def check_recovery_needed(repo_path: str, feature_list: List[Dict[str, Any]]) ->
     }
     
     if needs_commit or needs_push:
-        print(f"\n{'='*60}")
-        print(f"[SYNC] RECOVERY CHECK: Found pending operations")
-        print(f"   Features needing commit: {needs_commit}")
-        print(f"   Features needing push: {needs_push}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "RECOVERY CHECK: pending operations found — needs_commit=%s needs_push=%s",
+            needs_commit, needs_push
+        )
     
     return result
 
@@ -289,7 +344,7 @@ def get_recovery_features(repo_path: str, feature_list: List[Dict[str, Any]]) ->
     # Clean up orphaned pending ops (features that no longer exist)
     orphaned_ids = feature_ids_needing_recovery - valid_feature_ids
     if orphaned_ids:
-        print(f"[WARN]  Cleaning up orphaned pending ops: {orphaned_ids}")
+        logger.warning("Cleaning up orphaned pending ops: %s", orphaned_ids)
         for orphan_id in orphaned_ids:
             clear_all_pending(repo_path, orphan_id)
     
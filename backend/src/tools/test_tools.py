@@ -10,11 +10,88 @@ Compatible with LangChain 1.0 create_agent pattern
 """
 
 from langchain_core.tools import tool
+from src.utils import fastjson
+from src.utils.logging import logger
+import re
 import subprocess
-import json
 import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
 from typing import Optional
 
+# Streaming pytest runner limits: tail kept for the result dict, and the
+# same 3-minute budget subprocess.run used to enforce
+_MAX_TAIL_LINES = 2000
+_PYTEST_TIMEOUT = 180
+
+def _subprocess_env(**extra: str) -> dict:
+    """
+    Environment for test subprocesses
+
+    Copied from the live os.environ per call (main.py loads .env after
+    this module is imported, so a snapshot taken here would miss it).
+    PYTHONDONTWRITEBYTECODE keeps test runs from littering generated
+    repos with __pycache__ writes (and the commits that would pick
+    them up).
+    """
+    return {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", **extra}
+
+# sys.platform is a constant string — avoids importing platform (which can
+# probe the OS via subprocesses) on every test run
+_IS_WINDOWS = sys.platform.startswith("win")
+
+
+# Resolved venv interpreter per repo. Only hits are cached: the venv is
+# created partway through a run (by the init script), so a missing venv
+# must be re-probed on the next call rather than remembered as absent.
+_VENV_PYTHONS: dict = {}
+
+
+def _venv_python(repo_path: str) -> Optional[str]:
+    """Path to the project venv's python, or None if the venv doesn't exist"""
+    python_path = _VENV_PYTHONS.get(repo_path)
+    if python_path is not None:
+        return python_path
+    if _IS_WINDOWS:
+        python_path = os.path.join(repo_path, ".venv", "Scripts", "python.exe")
+    else:
+        python_path = os.path.join(repo_path, ".venv", "bin", "python")
+    if os.path.exists(python_path):
+        _VENV_PYTHONS[repo_path] = python_path
+        return python_path
+    return None
+
+
+# Captured test output is stored in result dicts that get JSON-serialized
+# to test-results/ — keep only the tail so a verbose run doesn't duplicate
+# megabytes of log text on disk. Failures report at the end, so the tail
+# is the part worth keeping.
+_MAX_LOG_BYTES = 64 * 1024
+
+
+def _tail_output(text: str) -> str:
+    """Truncate captured output to the last _MAX_LOG_BYTES characters"""
+    if len(text) <= _MAX_LOG_BYTES:
+        return text
+    return f"[truncated {len(text) - _MAX_LOG_BYTES} chars]\n" + text[-_MAX_LOG_BYTES:]
+
+
+def utc_timestamp() -> str:
+    """
+    Compact UTC timestamp for result filenames (YYYYMMDD_HHMMSS)
+
+    Built from a single time.gmtime() struct — much cheaper than
+    datetime.utcnow().strftime() and avoids the utcnow() deprecation.
+    """
+    now = time.gmtime()
+    return (
+        f"{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
+        f"_{now.tm_hour:02d}{now.tm_min:02d}{now.tm_sec:02d}"
+    )
+
 
 @tool
 def run_playwright_tests(
@@ -40,22 +117,31 @@ def run_playwright_tests(
         if test_spec:
             cmd.append(test_spec)
 
-        # Add JSON reporter for structured output
+        # Add JSON reporter for structured output. The report goes to a
+        # file (PLAYWRIGHT_JSON_OUTPUT_NAME) instead of the stdout pipe —
+        # for a large E2E suite the per-test JSON can be many MB that we
+        # would buffer in memory only to read three stats fields.
         cmd.extend(["--reporter=json"])
+        report_path = os.path.join(
+            tempfile.gettempdir(), f"playwright-report-{os.getpid()}.json"
+        )
 
         result = subprocess.run(
             cmd,
             cwd=repo_path,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=300  # 5 minute timeout for E2E tests
+            timeout=300,  # 5 minute timeout for E2E tests
+            env=_subprocess_env(PLAYWRIGHT_JSON_OUTPUT_NAME=report_path)
         )
 
-        # Parse Playwright JSON output
+        # Parse Playwright JSON report
         try:
-            output_data = json.loads(result.stdout)
-            total_tests = output_data.get("stats", {}).get("expected", 0)
-            passed_tests = output_data.get("stats", {}).get("ok", 0)
+            output_data = fastjson.load_path(report_path)
+            stats = output_data.get("stats", {})
+            total_tests = stats.get("expected", 0)
+            passed_tests = stats.get("ok", 0)
             failed_tests = total_tests - passed_tests
 
             return {
@@ -63,21 +149,26 @@ def run_playwright_tests(
                 "total_tests": total_tests,
                 "passed_tests": passed_tests,
                 "failed_tests": failed_tests,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "execution_time_ms": output_data.get("stats", {}).get("duration", 0)
+                "stdout": "",
+                "stderr": _tail_output(result.stderr),
+                "execution_time_ms": stats.get("duration", 0)
             }
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
+        except Exception:
+            # Fallback if the report is missing or unparseable
             return {
                 "passed": result.returncode == 0,
                 "total_tests": 0,
                 "passed_tests": 0,
                 "failed_tests": 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": "",
+                "stderr": _tail_output(result.stderr),
                 "execution_time_ms": 0
             }
+        finally:
+            try:
+                os.remove(report_path)
+            except OSError:
+                pass
 
     except subprocess.TimeoutExpired:
         return {
@@ -101,39 +192,54 @@ def run_playwright_tests(
         }
 
 
-def _parse_pytest_output(stdout: str, returncode: int) -> dict:
+# Compiled once at import — _parse_pytest_output runs per test execution
+# and these patterns scan the full (potentially large) pytest output
+_SUMMARY_RE = re.compile(r'(\d+)\s+(passed|failed|error|skipped|warning)', re.IGNORECASE)
+_PASSED_RE = re.compile(r'\bPASSED\b')
+_FAILED_RE = re.compile(r'\bFAILED\b')
+
+
+def _parse_pytest_output(
+    stdout: str,
+    returncode: int,
+    passed_hint: int = 0,
+    failed_hint: int = 0
+) -> dict:
     """
     Parse pytest verbose output to extract test counts
-    
+
     Parses lines like:
     - "5 passed" or "5 passed, 2 failed"
     - "PASSED" / "FAILED" markers in verbose output
+
+    passed_hint/failed_hint are marker counts gathered while streaming
+    the full output; they beat re-scanning a tail that may have lost
+    early lines.
     """
-    import re
-    
     total_tests = 0
     passed_tests = 0
     failed_tests = 0
-    
+
     # Try to find summary line like "5 passed, 2 failed, 1 error"
-    summary_pattern = r'(\d+)\s+(passed|failed|error|skipped|warning)'
-    matches = re.findall(summary_pattern, stdout, re.IGNORECASE)
-    
-    for count, status in matches:
+    for count, status in _SUMMARY_RE.findall(stdout):
         count = int(count)
         status = status.lower()
         if status == 'passed':
             passed_tests = count
         elif status == 'failed':
             failed_tests = count
-        total_tests += count if status in ['passed', 'failed'] else 0
-    
-    # If no summary found, count PASSED/FAILED lines in verbose output
+        total_tests += count if status in ('passed', 'failed') else 0
+
+    # If no summary found, count PASSED/FAILED markers in verbose output
     if total_tests == 0:
-        passed_tests = len(re.findall(r'\bPASSED\b', stdout))
-        failed_tests = len(re.findall(r'\bFAILED\b', stdout))
+        if passed_hint or failed_hint:
+            passed_tests = passed_hint
+            failed_tests = failed_hint
+        else:
+            passed_tests = len(_PASSED_RE.findall(stdout))
+            failed_tests = len(_FAILED_RE.findall(stdout))
         total_tests = passed_tests + failed_tests
-    
+
     return {
         "passed": returncode == 0 and failed_tests == 0,
         "total_tests": total_tests,
@@ -147,18 +253,18 @@ def _save_test_results(repo_path: str, feature_id: str, results: dict) -> str:
     Auto-save test results to test-results/ directory
     This is NOT a tool - it's called automatically by run_pytest_tests
     """
-    from datetime import datetime
-    
     results_dir = os.path.join(repo_path, "test-results")
     os.makedirs(results_dir, exist_ok=True)
+
+    results_file = os.path.join(results_dir, f"{feature_id}_{utc_timestamp()}.json")
     
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    results_file = os.path.join(results_dir, f"{feature_id}_{timestamp}.json")
-    
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    # Compact output — these files are read back by tools, not humans, and
+    # indenting a dict that embeds long stdout strings doubles the work
+    with open(results_file, "wb") as f:
+        f.write(fastjson.dumps(results))
+        f.write(b"\n")
     
-    print(f"\n[AUTO-SAVED] Test results: {results_file}")
+    logger.info("Auto-saved test results: %s", results_file)
     return results_file
 
 
@@ -186,34 +292,24 @@ def run_pytest_tests(
         >>> run_pytest_tests("/path/to/repo", "f-001", "tests/")
         {"passed": True, "total_tests": 10, "passed_tests": 10, ...}
     """
-    import platform
-    
-    print(f"\n{'='*50}")
-    print(f"RUNNING PYTEST for {feature_id}")
-    print(f"  repo: {repo_path}")
-    print(f"  test_path: {test_path or 'tests/'}")
-    print(f"{'='*50}")
-    
+    logger.info(
+        "Running pytest for %s (repo=%s, test_path=%s)",
+        feature_id, repo_path, test_path or "tests/"
+    )
+
     try:
         # Use the project's venv python to run pytest
         # This ensures tests run with project dependencies, not multi-agent dependencies
-        is_windows = platform.system() == "Windows"
-        venv_path = os.path.join(repo_path, ".venv")
-        
-        if is_windows:
-            python_path = os.path.join(venv_path, "Scripts", "python.exe")
-        else:
-            python_path = os.path.join(venv_path, "bin", "python")
-        
-        # Check if project venv exists
-        if os.path.exists(python_path):
+        python_path = _venv_python(repo_path)
+
+        if python_path:
             # Use project's python to run pytest as module
             cmd = [python_path, "-m", "pytest"]
-            print(f"  Using project venv: {python_path}")
+            logger.info("Using project venv: %s", python_path)
         else:
             # Fallback to system pytest (for backwards compatibility)
             cmd = ["pytest"]
-            print(f"  [WARN]  Project venv not found, using system pytest")
+            logger.warning("Project venv not found, using system pytest")
         
         if test_path:
             cmd.append(test_path)
@@ -222,34 +318,71 @@ def run_pytest_tests(
         
         # Add extra flags for better output parsing
         cmd.append("--tb=short")  # Short traceback for errors
-        
-        result = subprocess.run(
+
+        # Stream the child's output instead of buffering it whole — a
+        # verbose run over a big suite can emit tens of MB. Only a bounded
+        # tail is kept; PASSED/FAILED markers are counted on the fly so
+        # the fallback parse stays accurate even when early lines drop.
+        proc = subprocess.Popen(
             cmd,
             cwd=repo_path,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             encoding="utf-8",
-            timeout=180  # 3 minute timeout for unit tests
+            errors="replace",
+            env=_subprocess_env()
         )
 
+        timed_out = threading.Event()
+
+        def _kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(_PYTEST_TIMEOUT, _kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+
+        tail: deque = deque(maxlen=_MAX_TAIL_LINES)
+        passed_seen = 0
+        failed_seen = 0
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+                if _PASSED_RE.search(line):
+                    passed_seen += 1
+                elif _FAILED_RE.search(line):
+                    failed_seen += 1
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, _PYTEST_TIMEOUT)
+
+        output = "".join(tail)
+
         # Parse pytest output to get test counts
-        parsed = _parse_pytest_output(result.stdout, result.returncode)
-        
+        parsed = _parse_pytest_output(output, returncode, passed_seen, failed_seen)
+
         test_results = {
             "passed": parsed["passed"],
             "total_tests": parsed["total_tests"],
             "passed_tests": parsed["passed_tests"],
             "failed_tests": parsed["failed_tests"],
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "stdout": _tail_output(output),
+            "stderr": ""  # merged into stdout by the streaming runner
         }
         
         # AUTO-SAVE results (cannot be faked by LLM)
         _save_test_results(repo_path, feature_id, test_results)
         
-        print(f"  Result: {'PASSED' if parsed['passed'] else 'FAILED'}")
-        print(f"  Tests: {parsed['passed_tests']}/{parsed['total_tests']} passed")
-        print(f"{'='*50}\n")
+        logger.info(
+            "pytest %s: %d/%d passed",
+            "PASSED" if parsed["passed"] else "FAILED",
+            parsed["passed_tests"], parsed["total_tests"]
+        )
         
         return test_results
 
@@ -0,0 +1,53 @@
+"""
+Fast JSON helpers
+
+Thin wrapper around orjson with a stdlib json fallback so hot paths
+(polling widgets, log/result writers) get the fast parser when it's
+installed without making it a hard requirement.
+
+dumps() always returns bytes (orjson semantics) so callers open files
+in binary mode regardless of which backend is active.
+"""
+
+try:
+    import orjson
+
+    OPT_INDENT_2 = orjson.OPT_INDENT_2
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+    def dumps(obj, option: int = 0) -> bytes:
+        """Serialize obj to JSON bytes (pass OPT_INDENT_2 to pretty-print)"""
+        return orjson.dumps(obj, option=option)
+
+except ImportError:
+    import json
+
+    OPT_INDENT_2 = 1
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data):
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
+
+    def dumps(obj, option: int = 0) -> bytes:
+        """Serialize obj to JSON bytes (pass OPT_INDENT_2 to pretty-print)"""
+        indent = 2 if option & OPT_INDENT_2 else None
+        return json.dumps(obj, indent=indent).encode("utf-8")
+
+
+def load_path(path):
+    """
+    Read and parse a JSON file
+
+    Blocking — callers on an event loop should offload via
+    asyncio.to_thread so disk latency doesn't stall the loop.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+__all__ = ["loads", "dumps", "load_path", "OPT_INDENT_2", "JSONDecodeError"]
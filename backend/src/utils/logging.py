@@ -11,10 +11,19 @@ import sys
 from typing import Optional
 
 
+# Tracks whether basicConfig has run — repeat setup_logging calls only
+# adjust the level instead of silently no-opping on an existing handler
+_CONFIGURED = False
+
+
 def setup_logging(level: Optional[str] = None) -> logging.Logger:
     """
     Setup structured logging for the application
 
+    Idempotent: the first call installs the handler, later calls just
+    update the root level (so LOG_LEVEL changes and explicit levels
+    still take effect after import).
+
     Args:
         level: Optional log level (DEBUG, INFO, WARNING, ERROR)
 
@@ -25,20 +34,30 @@ def setup_logging(level: Optional[str] = None) -> logging.Logger:
         >>> logger = setup_logging()
         >>> logger.info("Application started")
     """
-    # Get log level from env or parameter
+    global _CONFIGURED
+
+    # Get log level from env or parameter; fall back to INFO on typos
+    # instead of crashing at import time
     log_level = level or os.getenv("LOG_LEVEL", "INFO")
+    resolved = logging.getLevelName(str(log_level).upper())
+    if not isinstance(resolved, int):
+        resolved = logging.INFO
+
+    if not _CONFIGURED:
+        # force=True replaces any handlers a test harness or re-import
+        # left behind, so our format actually applies
+        logging.basicConfig(
+            level=resolved,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            stream=sys.stdout,
+            force=True
+        )
+        _CONFIGURED = True
+    else:
+        logging.getLogger().setLevel(resolved)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout
-    )
-
-    # Create application logger
-    logger = logging.getLogger("app-builder")
-    return logger
+    return logging.getLogger("app-builder")
 
 
 # Default logger instance
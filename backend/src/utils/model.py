@@ -15,22 +15,21 @@ Supported providers:
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 from langchain.chat_models import init_chat_model
+import asyncio
+import atexit
 import os
+from functools import lru_cache
 from typing import Optional
 
-# Optional: Sambanova support (requires langchain_sambanova package)
+# Optional: Sambanova support (requires langchain_sambanova package).
+# Only the import is probed here — the client itself is built lazily in
+# get_sambanova_model so processes that never use it (CLI, tests) don't
+# pay for an HTTP client at import time.
 try:
     from langchain_sambanova import ChatSambaNova
-    os.environ["SAMBANOVA_API_KEY"] = "c2b461cc-a24d-4eb2-a537-08f13f9dea1c"
     SAMBANOVA_AVAILABLE = True
-    llm = ChatSambaNova(
-        model="gpt-oss-120b",
-        max_tokens=8192,
-        temperature=0.1,
-    )
 except ImportError:
     SAMBANOVA_AVAILABLE = False
-    llm = None
 
 def get_model(
     model_override: Optional[str] = None,
@@ -69,7 +68,50 @@ def get_model(
         "google_genai:gemini-2.5-flash-lite"
     )
 
+    return _build_model(model_name, temperature)
+
+
+def _build_direct(model_name: str, temperature: float) -> Optional[BaseChatModel]:
+    """
+    Fast path for known provider prefixes, skipping init_chat_model's
+    string parsing and registry dispatch
+
+    Returns None for unknown prefixes (or missing provider packages) so
+    the caller falls through to the generic path.
+    """
+    provider, sep, name = model_name.partition(":")
+    if not sep:
+        return None
+
     try:
+        if provider == "google_genai":
+            from langchain_google_genai import ChatGoogleGenerativeAI
+            return ChatGoogleGenerativeAI(model=name, temperature=temperature)
+        if provider == "anthropic":
+            from langchain_anthropic import ChatAnthropic
+            return ChatAnthropic(model=name, temperature=temperature)
+        if provider == "openai":
+            return ChatOpenAI(model=name, temperature=temperature)
+    except ImportError:
+        return None
+
+    return None
+
+
+@lru_cache(maxsize=32)
+def _build_model(model_name: str, temperature: float) -> BaseChatModel:
+    """
+    Construct (and memoize) a chat model for a (name, temperature) pair
+
+    Provider client construction is expensive (httpx pools, credential
+    parsing) and the preset helpers re-enter get_model on every agent
+    step, so one instance per config is shared across the process.
+    """
+    try:
+        # Known providers bypass init_chat_model's registry dispatch
+        model = _build_direct(model_name, temperature)
+        if model is not None:
+            return model
         # LangChain 1.0 pattern: init_chat_model() automatically infers provider
         return init_chat_model(model_name, temperature=temperature)
     except Exception as e:
@@ -95,6 +137,11 @@ def get_cheap_model() -> BaseChatModel:
     return get_model(temperature=1)
 
 
+# Tri-state Anthropic probe result: None = not yet tried, True/False
+# after the first attempt
+_ANTHROPIC_OK: Optional[bool] = None
+
+
 def get_smart_model() -> BaseChatModel:
     """
     Get best model for complex tasks (e.g., coding, reasoning)
@@ -109,27 +156,49 @@ def get_smart_model() -> BaseChatModel:
         >>> model = get_smart_model()
         >>> result = model.invoke([{"role": "user", "content": "Write a binary search"}])
     """
+    global _ANTHROPIC_OK
+
+    # A provider known to be missing/broken stays that way for the
+    # process — don't re-probe it on every agent step
+    if _ANTHROPIC_OK is False:
+        return get_cheap_model()
+
     # Try Claude first (best for coding)
     if os.getenv("ANTHROPIC_API_KEY"):
         try:
-            return get_model("anthropic:claude-sonnet-4-5-20250929", temperature=0)
+            model = get_model("anthropic:claude-sonnet-4-5-20250929", temperature=0)
+            _ANTHROPIC_OK = True
+            return model
         except Exception:
             print("[WARN]  Claude unavailable, falling back to Gemini")
+            _ANTHROPIC_OK = False
+    else:
+        _ANTHROPIC_OK = False
 
     # Fallback to Gemini
     return get_cheap_model()
 
+@lru_cache(maxsize=1)
+def _build_sambanova() -> BaseChatModel:
+    """Construct (and memoize) the Sambanova client on first use"""
+    return ChatSambaNova(
+        model="gpt-oss-120b",
+        max_tokens=8192,
+        temperature=0.1,
+    )
+
+
 def get_sambanova_model() -> BaseChatModel:
     """
     Get Sambanova model for complex tasks (e.g., coding, reasoning)
 
-    Requires langchain_sambanova package to be installed.
+    Requires the langchain_sambanova package and SAMBANOVA_API_KEY.
     Falls back to Gemini if not available.
     """
-    if not SAMBANOVA_AVAILABLE or llm is None:
+    if not SAMBANOVA_AVAILABLE or not os.getenv("SAMBANOVA_API_KEY"):
         print("[WARN]  Sambanova not available, falling back to Gemini")
         return get_cheap_model()
-    return llm
+    return _build_sambanova()
 
 
 def get_openrouter_model(
@@ -174,15 +243,75 @@ def get_openrouter_model(
         "kwaipilot/kat-coder-pro:free"
     )
 
+    return _build_openrouter_model(model, api_key, temperature)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_clients():
+    """
+    One pooled httpx client pair shared by all OpenRouter models
+
+    Each ChatOpenAI otherwise builds its own connection pool, so
+    concurrent agents re-open TLS to openrouter.ai instead of reusing
+    warm keep-alive connections. Built lazily so processes that never
+    touch OpenRouter allocate nothing.
+    """
+    import httpx
+
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    sync_client = httpx.Client(limits=limits, timeout=60.0)
+    async_client = httpx.AsyncClient(limits=limits, timeout=60.0)
+
+    def _close():
+        try:
+            sync_client.close()
+            asyncio.run(async_client.aclose())
+        except Exception:
+            pass
+
+    atexit.register(_close)
+    return sync_client, async_client
+
+
+@lru_cache(maxsize=32)
+def _build_openrouter_model(
+    model: str,
+    api_key: str,
+    temperature: float
+) -> BaseChatModel:
+    """Construct (and memoize) a ChatOpenAI instance pointed at OpenRouter"""
+    sync_client, async_client = _shared_http_clients()
     return ChatOpenAI(
         model=model,
         api_key=api_key,
         base_url="https://openrouter.ai/api/v1",
         temperature=temperature,
         max_tokens=8192,
+        http_client=sync_client,
+        http_async_client=async_client,
     )
 
 
+def clear_model_cache() -> None:
+    """Drop memoized model instances and probe results (mainly for tests)"""
+    global _ANTHROPIC_OK
+    _build_model.cache_clear()
+    _build_openrouter_model.cache_clear()
+    _ANTHROPIC_OK = None
+
+
+@lru_cache(maxsize=1)
+def _use_openrouter() -> bool:
+    """
+    Whether USE_OPENROUTER is enabled, resolved once per process
+
+    Evaluated lazily (not at import) so it still sees a .env loaded by
+    the entrypoint; tests can monkeypatch the env and call
+    _use_openrouter.cache_clear().
+    """
+    return os.getenv("USE_OPENROUTER", "false").lower() == "true"
+
+
 # Model presets for different agent types
 def get_initializer_model() -> BaseChatModel:
     """
@@ -191,9 +320,7 @@ def get_initializer_model() -> BaseChatModel:
     Uses Gemini by default (proven tool calling support).
     Set USE_OPENROUTER=true in .env to test OpenRouter instead.
     """
-    use_openrouter = os.getenv("USE_OPENROUTER", "false").lower() == "true"
-
-    if use_openrouter:
+    if _use_openrouter():
         try:
             print("[SYNC] Using OpenRouter for Initializer Agent")
             return get_openrouter_model()
@@ -212,9 +339,7 @@ def get_coding_model() -> BaseChatModel:
     Uses Gemini by default (proven tool calling support).
     Set USE_OPENROUTER=true in .env to test OpenRouter instead.
     """
-    use_openrouter = os.getenv("USE_OPENROUTER", "false").lower() == "true"
-
-    if use_openrouter:
+    if _use_openrouter():
         try:
             return get_openrouter_model()
         except ValueError:
@@ -231,9 +356,7 @@ def get_test_model() -> BaseChatModel:
     Uses Gemini by default (proven tool calling support).
     Set USE_OPENROUTER=true in .env to test OpenRouter instead.
     """
-    use_openrouter = os.getenv("USE_OPENROUTER", "false").lower() == "true"
-
-    if use_openrouter:
+    if _use_openrouter():
         try:
             return get_openrouter_model()
         except ValueError:
@@ -250,9 +373,7 @@ def get_qa_model() -> BaseChatModel:
     Uses Gemini by default (proven tool calling support).
     Set USE_OPENROUTER=true in .env to test OpenRouter instead.
     """
-    use_openrouter = os.getenv("USE_OPENROUTER", "false").lower() == "true"
-
-    if use_openrouter:
+    if _use_openrouter():
         try:
             return get_openrouter_model()
         except ValueError:
@@ -272,4 +393,5 @@ __all__ = [
     "get_coding_model",
     "get_test_model",
     "get_qa_model",
+    "clear_model_cache",
 ]
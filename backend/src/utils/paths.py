@@ -5,12 +5,18 @@ This module provides utilities to resolve paths relative to the project root,
 ensuring the application works correctly regardless of where it's executed from.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 
 # Project root is the backend directory (parent of src/)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Joined once — every Path `/` allocates a new object, and these two
+# directories are fixed for the process lifetime
+_CONFIG_DIR = PROJECT_ROOT / "config"
+_PROMPTS_DIR = _CONFIG_DIR / "prompts"
+
 
 def get_prompt_path(prompt_name: str) -> Path:
     """
@@ -26,7 +32,24 @@ def get_prompt_path(prompt_name: str) -> Path:
         >>> get_prompt_path("gitops.txt")
         Path('/path/to/backend/config/prompts/gitops.txt')
     """
-    return PROJECT_ROOT / "config" / "prompts" / prompt_name
+    return _PROMPTS_DIR / prompt_name
+
+
+@lru_cache(maxsize=64)
+def load_prompt(prompt_name: str) -> str:
+    """
+    Read a prompt file, caching its contents for the process lifetime
+
+    Agents re-read their system prompts on every (re)build; the files
+    never change at runtime, so one disk read per prompt is enough.
+
+    Args:
+        prompt_name: Name of the prompt file (e.g., "gitops.txt")
+
+    Returns:
+        Prompt file contents
+    """
+    return (_PROMPTS_DIR / prompt_name).read_text(encoding="utf-8")
 
 
 def get_config_path(config_name: str) -> Path:
@@ -43,4 +66,4 @@ def get_config_path(config_name: str) -> Path:
         >>> get_config_path("settings.json")
         Path('/path/to/backend/config/settings.json')
     """
-    return PROJECT_ROOT / "config" / config_name
+    return _CONFIG_DIR / config_name
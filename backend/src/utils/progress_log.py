@@ -0,0 +1,73 @@
+"""
+Append-only progress log helpers
+
+The progress log is newline-delimited JSON (progress_log.jsonl): each
+entry is appended as one line, so a write is O(1) instead of rewriting a
+JSON array that grows over the whole run. Readers consume it
+incrementally (the CLI LogViewer tracks a byte offset); read_entries
+still understands the legacy progress_log.json array for projects
+created before the format switch.
+"""
+
+import os
+
+from src.utils import fastjson
+
+JSONL_NAME = "progress_log.jsonl"
+LEGACY_NAME = "progress_log.json"
+
+
+def append_entry(repo_path: str, entry: dict) -> str:
+    """
+    Append one log entry to progress_log.jsonl
+
+    Args:
+        repo_path: Path to project repository
+        entry: Log entry dictionary
+
+    Returns:
+        Path to the log file
+    """
+    log_path = os.path.join(repo_path, JSONL_NAME)
+    with open(log_path, "ab") as f:
+        f.write(fastjson.dumps(entry) + b"\n")
+    return log_path
+
+
+def read_entries(repo_path: str) -> list[dict]:
+    """
+    Read all progress log entries in chronological order
+
+    Merges the legacy progress_log.json array (if present) with the
+    JSONL appends; corrupt lines are skipped.
+
+    Args:
+        repo_path: Path to project repository
+
+    Returns:
+        List of log entry dictionaries
+    """
+    entries: list[dict] = []
+
+    legacy_path = os.path.join(repo_path, LEGACY_NAME)
+    if os.path.exists(legacy_path):
+        try:
+            entries.extend(fastjson.load_path(legacy_path))
+        except Exception:
+            pass
+
+    log_path = os.path.join(repo_path, JSONL_NAME)
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as f:
+            for line in f.read().splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(fastjson.loads(line))
+                except fastjson.JSONDecodeError:
+                    continue
+
+    return entries
+
+
+__all__ = ["append_entry", "read_entries", "JSONL_NAME", "LEGACY_NAME"]
@@ -3,11 +3,44 @@ Token Counter - Phase 4.4
 Tracks token usage across agents and features for optimization decisions
 """
 
-import json
+import atexit
 import os
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
+from src.utils import fastjson
+
+
+# cl100k_base encoder, probed once at import: the bound encode_ordinary
+# method skips both the per-call registry lookup and the special-token
+# scan (untrusted text counts instead of raising). _ENCODE is None when
+# tiktoken is unavailable, so the fallback path never touches try/except.
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+    _ENCODE = _ENCODING.encode_ordinary
+except Exception:
+    _ENCODING = None
+    _ENCODE = None
+
+
+# Agent loops recount the same system prompts and stable message
+# prefixes on every step; memoizing their encoded lengths turns those
+# recounts into dict hits. Only short texts are cached, keeping the
+# worst case around 4 MB (1024 entries x 4 KB keys) — larger texts are
+# rarely re-counted verbatim and aren't worth pinning.
+_CACHE_TEXT_LIMIT = 4096
+
+
+@lru_cache(maxsize=1024)
+def _cached_len(text: str) -> int:
+    """Memoized token length for short texts"""
+    if _ENCODE is not None:
+        return len(_ENCODE(text))
+    return len(text) >> 2
+
 
 def count_tokens(text: str) -> int:
     """
@@ -20,16 +53,12 @@ def count_tokens(text: str) -> int:
     Returns:
         Approximate token count
     """
-    try:
-        import tiktoken
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
-    except ImportError:
-        # Fallback: rough estimation (1 token ≈ 4 characters)
-        return len(text) // 4
-    except Exception:
-        # Fallback for any other error
-        return len(text) // 4
+    if len(text) < _CACHE_TEXT_LIMIT:
+        return _cached_len(text)
+    if _ENCODE is not None:
+        return len(_ENCODE(text))
+    # Fallback: rough estimation (1 token ≈ 4 characters)
+    return len(text) >> 2
 
 
 def count_messages_tokens(messages: List) -> int:
@@ -42,14 +71,101 @@ def count_messages_tokens(messages: List) -> int:
     Returns:
         Total token count
     """
+    texts = [str(msg.content) for msg in messages if hasattr(msg, 'content')]
+    if not texts:
+        return 0
+
+    # Cacheable texts (the stable conversation prefix, system prompts)
+    # resolve as memoized lengths; oversized ones are batch-encoded in
+    # one C call with the special-token scan skipped
     total = 0
-    for msg in messages:
-        if hasattr(msg, 'content'):
-            content = str(msg.content)
-            total += count_tokens(content)
+    big = []
+    for text in texts:
+        if len(text) < _CACHE_TEXT_LIMIT:
+            total += _cached_len(text)
+        else:
+            big.append(text)
+
+    if big:
+        if _ENCODING is not None:
+            total += sum(map(len, _ENCODING.encode_ordinary_batch(big)))
+        else:
+            # Fallback: rough estimation (1 token ≈ 4 characters)
+            total += sum(len(text) for text in big) >> 2
+
     return total
 
 
+# Paths already confirmed (or converted) to line-delimited format — the
+# one-byte sniff only needs to happen once per file per process
+_JSONL_CHECKED: set = set()
+
+# Serialized log lines waiting to be written, keyed by log-file path.
+# Agents log on every step; batching the appends cuts the open/write/
+# close syscall cycle by the buffer factor.
+_LOG_BUFFER: dict = {}
+_LOG_BUFFER_MAX = int(os.getenv("TOKEN_LOG_BUFFER", "32"))
+
+
+def _flush_token_log(log_file: str) -> None:
+    """Write any buffered lines for one log file"""
+    lines = _LOG_BUFFER.pop(log_file, None)
+    if not lines:
+        return
+    try:
+        with open(log_file, "ab") as f:
+            f.writelines(lines)
+    except Exception as e:
+        print(f"[WARN]  Failed to write token_usage.json: {e}")
+
+
+def flush_token_logs() -> None:
+    """Flush all buffered token-usage lines (atexit / graceful shutdown)"""
+    for log_file in list(_LOG_BUFFER):
+        _flush_token_log(log_file)
+
+
+atexit.register(flush_token_logs)
+
+
+def _migrate_array_log(log_file: str) -> None:
+    """
+    Convert a legacy array-format token_usage.json to line-delimited JSON
+
+    The filename stays token_usage.json (the dashboard watches it by
+    name); only the internal layout changes to one object per line.
+    """
+    if log_file in _JSONL_CHECKED:
+        return
+
+    try:
+        with open(log_file, "rb") as f:
+            if f.read(1) == b"[":
+                f.seek(0)
+                logs = fastjson.loads(f.read())
+            else:
+                logs = None
+        if logs:
+            with open(log_file, "wb") as f:
+                for old_entry in logs:
+                    f.write(fastjson.dumps(old_entry))
+                    f.write(b"\n")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Corrupt legacy file (e.g. an array truncated by a crash).
+        # Reset it like the old rewrite path did — better to lose the
+        # unreadable history than to fail every append from here on.
+        print(f"[WARN]  Resetting corrupt token_usage.json: {e}")
+        try:
+            with open(log_file, "wb"):
+                pass
+        except OSError:
+            pass
+
+    _JSONL_CHECKED.add(log_file)
+
+
 def log_token_usage(
     agent_name: str,
     feature_id: str,
@@ -69,29 +185,23 @@ def log_token_usage(
     """
     log_file = os.path.join(repo_path, "token_usage.json")
 
-    # Load existing logs
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                logs = json.load(f)
-        except Exception:
-            logs = []
-    else:
-        logs = []
-
-    # Append new log entry
-    logs.append({
+    entry = {
         "timestamp": datetime.now().isoformat(),
         "agent": agent_name,
         "feature_id": feature_id,
         "token_count": token_count,
         "message_count": message_count
-    })
+    }
 
-    # Save updated logs
+    # One JSON line per entry, buffered in memory and appended in
+    # batches — O(1) per log call and one file open per _LOG_BUFFER_MAX
+    # entries instead of per entry
     try:
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(logs, f, indent=2)
+        _migrate_array_log(log_file)
+        buffer = _LOG_BUFFER.setdefault(log_file, [])
+        buffer.append(fastjson.dumps(entry) + b"\n")
+        if len(buffer) >= _LOG_BUFFER_MAX:
+            _flush_token_log(log_file)
     except Exception as e:
         print(f"[WARN]  Failed to write token_usage.json: {e}")
 
@@ -111,6 +221,9 @@ def get_token_stats(repo_path: str) -> dict:
     """
     log_file = os.path.join(repo_path, "token_usage.json")
 
+    # Push any buffered lines out first so the stats include them
+    _flush_token_log(log_file)
+
     if not os.path.exists(log_file):
         return {
             "total_tokens": 0,
@@ -119,34 +232,36 @@ def get_token_stats(repo_path: str) -> dict:
             "entries": 0
         }
 
-    try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            logs = json.load(f)
-    except Exception:
-        return {"total_tokens": 0, "by_agent": {}, "by_feature": {}, "entries": 0}
-
     total_tokens = 0
-    by_agent = {}
-    by_feature = {}
-
-    for entry in logs:
-        tokens = entry.get("token_count", 0)
-        agent = entry.get("agent", "unknown")
-        feature = entry.get("feature_id", "unknown")
+    by_agent: defaultdict = defaultdict(int)
+    by_feature: defaultdict = defaultdict(int)
+    entries = 0
 
-        total_tokens += tokens
+    try:
+        with open(log_file, "rb") as f:
+            if f.read(1) == b"[":
+                # Legacy array layout (pre-JSONL file not yet migrated)
+                f.seek(0)
+                logs = fastjson.loads(f.read())
+            else:
+                # Stream line-delimited entries without materializing a list
+                f.seek(0)
+                logs = (fastjson.loads(line) for line in f if line.strip())
 
-        if agent not in by_agent:
-            by_agent[agent] = 0
-        by_agent[agent] += tokens
+            for entry in logs:
+                get = entry.get
+                tokens = get("token_count", 0)
 
-        if feature not in by_feature:
-            by_feature[feature] = 0
-        by_feature[feature] += tokens
+                total_tokens += tokens
+                entries += 1
+                by_agent[get("agent", "unknown")] += tokens
+                by_feature[get("feature_id", "unknown")] += tokens
+    except Exception:
+        return {"total_tokens": 0, "by_agent": {}, "by_feature": {}, "entries": 0}
 
     return {
         "total_tokens": total_tokens,
-        "by_agent": by_agent,
-        "by_feature": by_feature,
-        "entries": len(logs)
+        "by_agent": dict(by_agent),
+        "by_feature": dict(by_feature),
+        "entries": entries
     }
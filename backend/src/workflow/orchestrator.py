@@ -18,6 +18,7 @@ from datetime import datetime
 from langgraph.graph import StateGraph, START, END
 from langchain_core.messages import SystemMessage, HumanMessage
 from src.state.schemas import AppBuilderState
+from src.utils import progress_log
 from src.tools.memory_tools import cleanup_tool_messages, create_feature_context_message
 from src.tools.recovery_tools import (
     mark_pending,
@@ -41,7 +42,10 @@ from src.workflow.routers import (
 
 def log_progress(repo_path: str, agent: str, feature_id: str, action: str, notes: str = "") -> None:
     """
-    Automatically log progress to progress_log.json
+    Automatically log progress to the append-only progress log
+
+    Entries go to progress_log.jsonl as single-line appends (O(1) per
+    entry instead of rewriting the whole array).
 
     Args:
         repo_path: Path to project repository
@@ -50,19 +54,6 @@ def log_progress(repo_path: str, agent: str, feature_id: str, action: str, notes
         action: Action performed (e.g., "implemented", "tested", "documented")
         notes: Optional additional notes
     """
-    log_path = os.path.join(repo_path, "progress_log.json")
-
-    # Read existing log
-    if os.path.exists(log_path):
-        try:
-            with open(log_path, "r", encoding="utf-8") as f:
-                logs = json.load(f)
-        except Exception:
-            logs = []
-    else:
-        logs = []
-
-    # Create new entry
     entry = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "agent": agent,
@@ -71,12 +62,8 @@ def log_progress(repo_path: str, agent: str, feature_id: str, action: str, notes
         "notes": notes
     }
 
-    # Append and save
-    logs.append(entry)
-
     try:
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(logs, f, indent=2)
+        progress_log.append_entry(repo_path, entry)
         print(f"[PROGRESS] [{agent}] {feature_id} - {action}")
     except Exception as e:
         print(f"[WARNING] Failed to log progress: {e}")